@@ -1,19 +1,18 @@
 from parapy.core import *
 from parapy.geom import *
-from parapy.core.snapshot import write_snapshot, read_snapshot
 from parapy.core.validate import *
-from parapy.exchange.step import STEPWriter
 import numpy as np
+import math
 import os
-from datetime import *
-from parapy.gui.display import get_top_window
-from parapy.gui.camera import MinimalCamera
+from pathlib import Path
+from datetime import datetime
 from hydrogen_aircraft import Fuselage, AvlAnalysis, LiftingSurface, Turbofan, COGVisualisation, \
-    range_equation, isa_calculator, center_of_gravity_x, write_output_txt_file, \
+    range_equation, range_sweep, isa_calculator, center_of_gravity_x, write_output_txt_file, \
     create_payload_range_diagram
-from tkinter import Tk, messagebox
 
 DIR = os.path.dirname(__file__)
+OUTPUT_DIR = Path('output')
+SAVES_DIR = Path('saves')
 
 
 class Aircraft(GeomBase):
@@ -59,9 +58,8 @@ class Aircraft(GeomBase):
 
     @Input
     def fuel_fractions_hydrogen(self):
-        return [1 - (1 - fuel_fraction) * 42.8 / 142 *
-                self.efficiency_power_conv_kero / self.efficiency_power_conv_h2
-                for fuel_fraction in self.fuel_fractions_roskam]
+        energy_ratio = 42.8 / 142 * self.efficiency_power_conv_kero / self.efficiency_power_conv_h2
+        return 1 - (1 - np.asarray(self.fuel_fractions_roskam)) * energy_ratio
 
     efficiency_power_conv_kero = Input(0.3, validator=Range(0, 1))
     efficiency_power_conv_h2 = Input(0.3, validator=Range(0, 1))
@@ -69,10 +67,10 @@ class Aircraft(GeomBase):
     reserve_fuel_percentage = Input(5, validator=Range(0, 20, incl_min=True, incl_max=True))  # [%]
 
     # Propulsion System
-    n_engines = Input(2, validator=Positive() and IsInstance(int))
-    engine_centerline_y = Input(5.75, validator=Positive() and is_real_number)  # [m]
-    engine_front_x = Input(11.14, validator=Positive() and is_real_number)  # [m]
-    engine_length = Input(2.6, validator=Positive() and is_real_number)  # [m]
+    n_engines = Input(2, validator=And(Positive(), IsInstance(int)))
+    engine_centerline_y = Input(5.75, validator=And(Positive(), is_real_number))  # [m]
+    engine_front_x = Input(11.14, validator=And(Positive(), is_real_number))  # [m]
+    engine_length = Input(2.6, validator=And(Positive(), is_real_number))  # [m]
 
     # Fuel tank
     tank_volume_fraction = Input(0.92)  # [-] from the Cryo-V report
@@ -163,6 +161,18 @@ class Aircraft(GeomBase):
                               self.cruise_mach_number, self.cruise_speed_of_sound,
                               self.port_turbofan.tsfc_cal, self.cl_cd)
 
+    @Attribute
+    def payload_range_curve(self):
+        """Ranges [m] and payload masses [kg] from maximum payload to ferry range"""
+        payload_masses = np.linspace(self.pax_mass + self.cargo_mass, 0., 50)
+        ranges = range_sweep(self.fuel_mass, payload_masses, self.pax_mass + self.cargo_mass,
+                             self.maximum_takeoff_mass,
+                             self.operational_empty_mass + self.fuel_mass,
+                             self.reserve_fuel_percentage, self.fuel_fractions_hydrogen,
+                             self.cruise_mach_number, self.cruise_speed_of_sound,
+                             self.port_turbofan.tsfc_cal, self.cl_cd)
+        return ranges, payload_masses
+
     @Attribute
     def n_passengers(self):
         return self.fuselage.n_pax
@@ -182,7 +192,12 @@ class Aircraft(GeomBase):
     def cargo_mass(self):
         """Mass of all cargo in [kg]"""
         return 161 * (self.fuselage.n_cargo_containers_fore + self.fuselage.n_cargo_containers_aft
-                      ) * self.root.fuselage.cargo_containers_fore[0].cargo_container.volume
+                      ) * self.cargo_container_volume
+
+    @Attribute
+    def cargo_container_volume(self):
+        """Internal volume of a single cargo container in [m3]"""
+        return self.fuselage.cargo_containers_fore[0].cargo_container.volume
 
     @Attribute
     def maximum_takeoff_mass(self):
@@ -194,6 +209,18 @@ class Aircraft(GeomBase):
         """Mass of all fuel in [kg]"""
         return self.fuselage.total_tank_volume * self.tank_volume_fraction * self.rho_lh2
 
+    @Attribute
+    def fwd_tank_fuel_mass(self):
+        """Mass of fuel in the fwd LH2 tank in [kg], zero if there is only one tank"""
+        if self.fuselage.n_hydrogen_tanks == 2:
+            return self.fuselage.fwd_hydrogen_tank.tank_volume * self.rho_lh2
+        return 0
+
+    @Attribute
+    def aft_tank_fuel_mass(self):
+        """Mass of fuel in the aft LH2 tank in [kg]"""
+        return self.fuselage.aft_hydrogen_tank.tank_volume * self.rho_lh2
+
     @Attribute
     def tank_mass(self):
         """Mass of LH2 tanks in [kg]"""
@@ -287,51 +314,51 @@ class Aircraft(GeomBase):
         return (self.mac_in * self.planform_area_in + (self.mainwing_kinkloc + self.mac_out) *
                 self.planform_area_out) / self.planform_area
 
+    @Attribute
+    def tan_sweep(self):
+        """Tangent of the main wing leading edge sweep angle [-]"""
+        return math.tan(math.radians(self.mainwing_sweep))
+
     @Attribute
     def x_mac(self):
         """LEMAC position in [m]"""
-        return self.wing_fraction_x * self.fuselage.l_fuselage + np.tan(
-            np.radians(self.mainwing_sweep)) * self.y_mac
+        return self.wing_fraction_x * self.fuselage.l_fuselage + self.tan_sweep * self.y_mac
 
     @Attribute
     def oswald_efficiency(self):
         """Oswald efficiency factor (e) taken from AVL [-]"""
-        return self.avl_interface.results['cruise']['Totals']['e']
+        return self.cruise_totals['e']
 
     # AVL attributes
     @Attribute
     def avl_surfaces(self):
         """All instances of AVL surface definition"""
-        return [self.right_mainwing_root.avl_surface, self.right_horztail_root.avl_surface,
-                self.verttail_root.avl_surface]
+        return (self.right_mainwing_root.avl_surface, self.right_horztail_root.avl_surface,
+                self.verttail_root.avl_surface)
 
     @Attribute
     def cl_cruise(self):
         """CL required during midcruise"""
-        return (self.midcruise_weight * 9.81) / \
-               (0.5 * isa_calculator(self.cruise_altitude)[2] *
-                ((self.cruise_mach_number * np.sqrt(1.4 * 287.085 * isa_calculator(
-                    self.cruise_altitude)[0])) ** 2)
-                * self.planform_area)
+        t_cruise, _, rho_cruise = self.isa_cruise
+        v_cruise_squared = self.cruise_mach_number ** 2 * 1.4 * 287.085 * t_cruise
+        return self.midcruise_weight * 9.81 / (0.5 * rho_cruise * v_cruise_squared *
+                                               self.planform_area)
 
     @Attribute
     def avl_interface(self):
         """AVL interface"""
-        return AvlAnalysis(name=self.baseline_aircraft,
-                           ref_area=self.planform_area,
-                           avl_surfaces=self.avl_surfaces,
-                           ref_span=self.mainwing_span,
-                           mac=self.mac,
-                           mach=self.cruise_mach_number,
-                           cl=self.cl_cruise,
-                           cd0=self.cd0_cruise).interface
+        return self.avl_analysis.interface
+
+    @Attribute
+    def cruise_totals(self):
+        """Total force coefficients and reference values of the AVL cruise case"""
+        return self.avl_interface.results['cruise']['Totals']
 
     @Attribute
     def cl_cd(self):
         """Aircraft lift to drag ratio during cruise"""
-        cl = self.avl_interface.results['cruise']['Totals']['CLtot']
-        cd = self.avl_interface.results['cruise']['Totals']['CDtot']
-        return cl / cd
+        totals = self.cruise_totals
+        return totals['CLtot'] / totals['CDtot']
 
     # Miscellaneous attributes
     lhv_lh2 = Attribute(120.0)  # [MJ/kg]
@@ -340,20 +367,23 @@ class Aircraft(GeomBase):
     @Attribute
     def aircraft_cog_analysis(self):
         """Aircraft x c.g. position"""
+        # the fwd tank only exists if there are two hydrogen tanks
+        if self.fuselage.n_hydrogen_tanks == 2:
+            tank1_cog_x = self.fuselage.fwd_hydrogen_tank.tank_cylindrical_section.cog.x
+        else:
+            tank1_cog_x = 0
+
         return center_of_gravity_x(
             mainwing_cog_x=self.right_mainwing.cog.x,
             horztail_cog_x=self.right_horztail.cog.x,
             verttail_cog_x=self.verttail.cog.x,
             fuselage_cog_x=0.45 * self.fuselage.l_fuselage,
-            tank1_cog_x=self.fuselage.fwd_hydrogen_tank.tank_cylindrical_section.cog.x if
-            self.fuselage.n_hydrogen_tanks == 2 else 0,
-            w_tank1=self.fuselage.fwd_hydrogen_tank.tank_volume * self.rho_lh2 * 0.9 if
-            self.fuselage.n_hydrogen_tanks == 2 else 0,
-            w_tank1_fuel=self.fuselage.fwd_hydrogen_tank.tank_volume * self.rho_lh2 * 1.0 if
-            self.fuselage.n_hydrogen_tanks == 2 else 0,
+            tank1_cog_x=tank1_cog_x,
+            w_tank1=0.9 * self.fwd_tank_fuel_mass,
+            w_tank1_fuel=self.fwd_tank_fuel_mass,
             tank2_cog_x=self.fuselage.aft_hydrogen_tank.tank_cylindrical_section.cog.x,
-            w_tank2=self.fuselage.aft_hydrogen_tank.tank_volume * self.rho_lh2 * 0.9,
-            w_tank2_fuel=self.fuselage.aft_hydrogen_tank.tank_volume * self.rho_lh2 * 1.0,
+            w_tank2=0.9 * self.aft_tank_fuel_mass,
+            w_tank2_fuel=self.aft_tank_fuel_mass,
             mainwing_wingbox_cog_x=self.fuselage.mainwing_wingbox.cog.x,
             apu_cog_x=self.fuselage.auxiliary_power_unit.shape_in.cog.x,
             nosebox_cog_x=self.fuselage.nosebox.direct_children[0].cog.x,
@@ -363,16 +393,13 @@ class Aircraft(GeomBase):
             pilot_cog_x=self.fuselage.cockpit_seats[0].position.x + ((2 / 3) *
                                                                      self.fuselage.cockpit_seats
                                                                      [0].seat_depth),
-            firstclassseats_cog_x=[
-                self.fuselage.port_firstclass_rows[i].simple_seat_volume.cog.x
-                for i in np.arange(self.fuselage.n_firstclass_rows)],
-            economyseats_cog_x=[self.fuselage.port_economy_rows[i].simple_seat_volume.cog.x for
-                                i in np.arange(self.fuselage.n_economy_rows)],
-            cargocontainer_cog_x=[self.fuselage.cargo_containers_fore[i].container_uncut.cog.x
-                                  for
-                                  i in np.arange(self.fuselage.n_cargo_containers_fore)],
-            cargocontainer_vol=self.root.fuselage.cargo_containers_fore[
-                0].cargo_container.volume,
+            firstclassseats_cog_x=self.fuselage.firstclass_seats_cog_x,
+            economyseats_cog_x=self.fuselage.economy_seats_cog_x,
+            cargocontainer_cog_x=np.fromiter(
+                (container.container_uncut.cog.x
+                 for container in self.fuselage.cargo_containers_fore),
+                dtype=np.float64, count=self.fuselage.n_cargo_containers_fore),
+            cargocontainer_vol=self.cargo_container_volume,
             n_firstclassseats_row=self.fuselage.n_seats_port_firstclass +
                                   self.fuselage.n_seats_starboard_firstclass,
             n_economyseats_row=self.fuselage.n_seats_port_economy +
@@ -387,8 +414,7 @@ class Aircraft(GeomBase):
     def mainwing_wingbox_x_start(self):
         """Fwd x position of the wing box. The leading edge of the airfoil that intersects
             the fuselage"""
-        return min(self.right_mainwing.edges[0].sample_points[idx].x for idx in range(len(
-            self.right_mainwing.edges[0].sample_points)))
+        return min(point.x for point in self.right_mainwing.edges[0].sample_points)
 
     @Attribute
     def mainwing_wingbox_x_end(self):
@@ -396,19 +422,28 @@ class Aircraft(GeomBase):
                 the fuselage"""
         return self.right_mainwing.vertices[0].point.x
 
+    @Attribute
+    def tailcone_cut_tool(self):
+        """Inner tail cone section used to trim the empennage roots, shared by all tail
+        surfaces"""
+        return self.fuselage.fus_structure.inner_tailcone_section
+
     @Attribute
     def midcruise_weight(self):
-        return (self.maximum_takeoff_mass *
-                (self.fuel_fractions_roskam[0] * self.fuel_fractions_roskam[1]
-                 * self.fuel_fractions_roskam[2] * self.fuel_fractions_roskam[
-                     3] * self.fuel_fractions_roskam[4] +
-                 self.fuel_fractions_roskam[0] * self.fuel_fractions_roskam[1]
-                 * self.fuel_fractions_roskam[2] * self.fuel_fractions_roskam[3])) / 2
+        """Average of the aircraft weight at the start and end of cruise in [kg]"""
+        ff = self.fuel_fractions_roskam
+        ff_start_cruise = ff[0] * ff[1] * ff[2] * ff[3]
+        return self.maximum_takeoff_mass * ff_start_cruise * (1 + ff[4]) / 2
+
+    @Attribute
+    def isa_cruise(self):
+        """ISA temperature [K], pressure [Pa] and density [kg/m3] at cruise altitude"""
+        return isa_calculator(self.cruise_altitude)
 
     @Attribute
     def cruise_speed_of_sound(self):
         """Speed of sound at cruise altitude in  [m/s]"""
-        return np.sqrt(1.4 * 287.085 * isa_calculator(self.cruise_altitude)[0])
+        return np.sqrt(1.4 * 287.085 * self.isa_cruise[0])
 
     @Attribute
     def total_cruise_thrust(self):
@@ -421,7 +456,10 @@ class Aircraft(GeomBase):
 
     @action(label='Save snapshot to .json file')  # save all modified values to .json file
     def save_full_aircraft(self):
-        save_name = 'saves\\save_{date:%Y-%m-%d_%H%M%S}.json'.format(date=datetime.now())
+        from parapy.core.snapshot import write_snapshot
+        from tkinter import messagebox
+        timestamp = datetime.now().strftime('%Y-%m-%d_%H%M%S')
+        save_name = str(SAVES_DIR / f'save_{timestamp}.json')
         with open(save_name, 'w') as save_file:
             write_snapshot(self, save_file)
 
@@ -430,8 +468,10 @@ class Aircraft(GeomBase):
 
     @action(label='Export geometry to .stp file')
     def stepwriter_components(self):
-        filename = 'output/' + 'Airbus_' + self.baseline_aircraft + \
-                   '_{date:%Y-%m-%d_%H%M%S}'.format(date=datetime.now()) + ".stp"
+        from parapy.exchange.step import STEPWriter
+        from tkinter import messagebox
+        timestamp = datetime.now().strftime('%Y-%m-%d_%H%M%S')
+        filename = str(OUTPUT_DIR / f'Airbus_{self.baseline_aircraft}_{timestamp}.stp')
         STEPWriter(filename=filename,
                    nodes=[self.right_mainwing,
                           self.left_mainwing,
@@ -444,33 +484,34 @@ class Aircraft(GeomBase):
 
     @action(label='Write output .txt file')
     def write_output_file(self):
-        filename = 'output/' + 'Airbus_' + self.baseline_aircraft + '_' + \
-                   '{date:%Y-%m-%d_%H%M%S}'.format(date=datetime.now())
+        from tkinter import messagebox
+        timestamp = datetime.now().strftime('%Y-%m-%d_%H%M%S')
+        filename = str(OUTPUT_DIR / f'Airbus_{self.baseline_aircraft}_{timestamp}')
         write_output_txt_file(aircraft=self.baseline_aircraft,
                               filename=filename,
                               output_list= \
-                                  [['Total tank volume', self.fuselage.total_tank_volume, '[m3]'],
-                                   ['Total tank mass', self.tank_mass, '[kg]'],
-                                   ['Total fuel mass', self.fuel_mass, '[kg]'],
-                                   ['Fuselage length', self.fuselage.l_fuselage, '[m]'],
-                                   ['Cabin length', self.fuselage.l_cabin, '[m]'],
-                                   ['PAX', self.n_passengers, '[-]'],
-                                   ['No. first class rows',
-                                    self.fuselage.n_firstclass_rows, '[-]'],
-                                   ['First class config.',
-                                    str(self.fuselage.n_seats_port_firstclass) + '-'
-                                    + str(self.fuselage.n_seats_starboard_firstclass), '[-]'],
-                                   ['No. economy class rows',
-                                    self.fuselage.n_economy_rows, '[-]'],
-                                   ['Economy class config.',
-                                    str(self.fuselage.n_seats_port_economy) + '-'
-                                    + str(self.fuselage.n_seats_starboard_economy), '[-]'],
-                                   ['No. cargo containers fwd',
-                                    self.fuselage.n_cargo_containers_fore, '[-]'],
-                                   ['No. cargo containers aft',
-                                    self.fuselage.n_cargo_containers_aft, '[-]']],
+                                  (('Total tank volume', self.fuselage.total_tank_volume, '[m3]'),
+                                   ('Total tank mass', self.tank_mass, '[kg]'),
+                                   ('Total fuel mass', self.fuel_mass, '[kg]'),
+                                   ('Fuselage length', self.fuselage.l_fuselage, '[m]'),
+                                   ('Cabin length', self.fuselage.l_cabin, '[m]'),
+                                   ('PAX', self.n_passengers, '[-]'),
+                                   ('No. first class rows',
+                                    self.fuselage.n_firstclass_rows, '[-]'),
+                                   ('First class config.',
+                                    f'{self.fuselage.n_seats_port_firstclass}-'
+                                    f'{self.fuselage.n_seats_starboard_firstclass}', '[-]'),
+                                   ('No. economy class rows',
+                                    self.fuselage.n_economy_rows, '[-]'),
+                                   ('Economy class config.',
+                                    f'{self.fuselage.n_seats_port_economy}-'
+                                    f'{self.fuselage.n_seats_starboard_economy}', '[-]'),
+                                   ('No. cargo containers fwd',
+                                    self.fuselage.n_cargo_containers_fore, '[-]'),
+                                   ('No. cargo containers aft',
+                                    self.fuselage.n_cargo_containers_aft, '[-]')),
                               aero_analysis=self.port_turbofan.aero_engine_calculations,
-                              avl_results=self.avl_interface.results['cruise'],
+                              avl_results=self.cruise_totals,
                               cl_cd=self.cl_cd,
                               cg_mac=self.cog_of_mac,
                               cg_analysis=self.aircraft_cog_analysis,
@@ -482,39 +523,40 @@ class Aircraft(GeomBase):
 
     @action(label='Print views to .jpg files')
     def create_images(self):
-        filename_num = '{date:%Y-%m-%d_%H%M%S}'.format(date=datetime.now())
+        from parapy.gui.display import get_top_window
+        from parapy.gui.camera import MinimalCamera
+        from tkinter import messagebox
+        timestamp = datetime.now().strftime('%Y-%m-%d_%H%M%S')
 
         main_window = get_top_window()
         viewer = main_window.viewer
 
-        filename_image1 = 'Airbus_' + self.baseline_aircraft + '_top_view_' + filename_num + '.jpg'
+        filename_image1 = f'Airbus_{self.baseline_aircraft}_top_view_{timestamp}.jpg'
         viewer.set_camera(MinimalCamera(viewing_center=Point(0, 0, 0),
                                         eye_location=Point(0, 0, 5),
                                         up_direction=Vector(0, 1, 0),
                                         scale=4, aspect_ratio=1.5))
         viewer.fit_all()
-        main_window.viewer.save_image('output/' + filename_image1)
+        main_window.viewer.save_image(str(OUTPUT_DIR / filename_image1))
 
-        filename_image2 = 'Airbus_' + self.baseline_aircraft + '_side_view_' + filename_num + \
-                          '.jpg'
+        filename_image2 = f'Airbus_{self.baseline_aircraft}_side_view_{timestamp}.jpg'
         viewer.set_camera(MinimalCamera(viewing_center=Point(0, 0, 0),
                                         eye_location=Point(0, -5, 0),
                                         up_direction=Vector(0, 0, 1),
                                         scale=4, aspect_ratio=1.5))
         viewer.fit_all()
-        main_window.viewer.save_image('output/' + filename_image2)
+        main_window.viewer.save_image(str(OUTPUT_DIR / filename_image2))
 
-        filename_image3 = 'Airbus_' + self.baseline_aircraft + '_iso_view_' + filename_num + \
-                          '.jpg'
+        filename_image3 = f'Airbus_{self.baseline_aircraft}_iso_view_{timestamp}.jpg'
         viewer.set_camera(MinimalCamera(viewing_center=Point(0, 0, 0),
                                         eye_location=Point(-5, -5, 3),
                                         up_direction=Vector(0, 0, 1),
                                         scale=4, aspect_ratio=1.5))
         viewer.fit_all()
-        main_window.viewer.save_image('output/' + filename_image3)
+        main_window.viewer.save_image(str(OUTPUT_DIR / filename_image3))
 
         return messagebox.showinfo(title='Success',
-                                   message='Images successfully written to ' + '/output/')
+                                   message=f'Images successfully written to {OUTPUT_DIR}')
 
     # Analysis actions
 
@@ -522,7 +564,7 @@ class Aircraft(GeomBase):
     def payload_range_diagram(self):
         return create_payload_range_diagram(self.max_payload_range, self.pax_mass +
                                             self.cargo_mass, self.ferry_range,
-                                            self.baseline_aircraft)
+                                            self.baseline_aircraft, self.payload_range_curve)
 
     @action(label='Plot and export climb rate diagram')
     def climb_rate_diagram(self):
@@ -580,7 +622,7 @@ class Aircraft(GeomBase):
     @Part
     def right_mainwing(self):
         return SubtractedSolid(
-            shape_in=self.right_mainwing_root.lofted_solid,
+            shape_in=self.right_mainwing_root.lofted_shape,
             tool=self.fuselage.fus_structure.inner_cylindrical_section,
             color='gray',
             mesh_deflection=0.0001)
@@ -591,7 +633,7 @@ class Aircraft(GeomBase):
                              reference_point=self.position,
                              vector1=self.position.Vz,
                              vector2=self.position.Vx,
-                             mesh_deflection=0.0001,
+                             mesh_deflection=self.right_mainwing.mesh_deflection,
                              color='gray')
 
     @Part
@@ -626,8 +668,8 @@ class Aircraft(GeomBase):
     @Part
     def right_horztail(self):
         return SubtractedSolid(
-            shape_in=self.right_horztail_root.lofted_solid,
-            tool=self.fuselage.fus_structure.inner_tailcone_section,
+            shape_in=self.right_horztail_root.lofted_shape,
+            tool=self.tailcone_cut_tool,
             color='gray',
             mesh_deflection=0.0001)
 
@@ -637,7 +679,7 @@ class Aircraft(GeomBase):
                              reference_point=self.position,
                              vector1=self.position.Vz,
                              vector2=self.position.Vx,
-                             mesh_deflection=0.0001,
+                             mesh_deflection=self.right_horztail.mesh_deflection,
                              color='gray')
 
     @Part(in_tree=False)
@@ -665,11 +707,24 @@ class Aircraft(GeomBase):
     @Part
     def verttail(self):
         return SubtractedSolid(
-            shape_in=self.verttail_root.lofted_solid,
-            tool=self.fuselage.fus_structure.inner_tailcone_section,
+            shape_in=self.verttail_root.lofted_shape,
+            tool=self.tailcone_cut_tool,
             color='gray',
             mesh_deflection=0.0001)
 
+    @Part(in_tree=False)
+    def avl_analysis(self):
+        """AVL analysis in midcruise. Kept as a part such that only the slots affected by a
+        change are invalidated and the analysis is not rebuilt from scratch"""
+        return AvlAnalysis(name=self.baseline_aircraft,
+                           ref_area=self.planform_area,
+                           avl_surfaces=self.avl_surfaces,
+                           ref_span=self.mainwing_span,
+                           mac=self.mac,
+                           mach=self.cruise_mach_number,
+                           cl=self.cl_cruise,
+                           cd0=self.cd0_cruise)
+
     @Part
     def cog_visualisation(self):
         return COGVisualisation(pass_down='mac, x_mac, mainwing_span, aircraft_cog_x',
@@ -680,6 +735,9 @@ class Aircraft(GeomBase):
 if __name__ == '__main__':
 
     # ask user if a previous save should be opened
+    from ast import literal_eval
+    from itertools import islice
+    from parapy.core.snapshot import read_snapshot
     from tkinter import Tk, messagebox
     from tkinter.filedialog import askopenfilename
 
@@ -701,12 +759,10 @@ if __name__ == '__main__':
 
         # update values with input file values
         with open(input_file_path) as f:
-            i = 0
-            for line in f:
-                if i > 3:  # the input file should have four lines of text that are ignored
-                    (key, val) = line.split()
-                    exec('obj.' + str(key) + '=' + str(val))
-                i += 1
+            # the input file should have four lines of text that are ignored
+            for line in islice(f, 4, None):
+                (key, val) = line.split()
+                setattr(obj, key, literal_eval(val))
 
     from parapy.gui import display
 
@@ -1,10 +1,21 @@
 from parapy.core import *
 from parapy.geom import *
 from parapy.core.validate import *
+import numpy as np
 import os
+from functools import lru_cache
 from hydrogen_aircraft import AIRFOIL_DIR
 
 
+@lru_cache(maxsize=None)
+def load_airfoil_points(airfoil_name):
+    """Returns a read-only (N, 2) array of the x and z coordinates in the .dat file of
+    airfoil_name. Cached, as every lifting surface reads the same few airfoil files."""
+    points = np.loadtxt(os.path.join(AIRFOIL_DIR, airfoil_name + '.dat'))
+    points.setflags(write=False)
+    return points
+
+
 class Airfoil(FittedCurve):
     """
     KBE Assignment 2021: Hydrogen Retrofitted Aircraft
@@ -24,38 +35,29 @@ class Airfoil(FittedCurve):
     # ratio is taken as the same as the airfoil .dat file
     mesh_deflection = Input(0.0001)
 
+    @Attribute
+    def raw_points(self):
+        """Returns (N, 2) array of the unscaled x and z coordinates in the airfoil .dat file"""
+        return load_airfoil_points(self.airfoil_name)
+
     @Attribute
     def tc_airfoildata(self):
         """Returns thickness to chord ratio of raw airfoil .dat file if self.tc != 1"""
         if self.tc != 1:
-            with open(os.path.join(AIRFOIL_DIR, self.airfoil_name + '.dat'), 'r') as f:
-                point_lst1 = []
-                for line in f:
-                    x, z = line.split(' ', 1)
-                    point_lst1.append([float(x), float(z)])
-
-            i = int((len(point_lst1) - 1) / 2)
-            lst_tophalf = point_lst1[:i + 1]
-            lst_bothalf = point_lst1[i:]
-            lst_bothalf2 = lst_bothalf[::-1]
-
-            return max([lst_tophalf[j][1] - lst_bothalf2[j][1]] for j in range(len(lst_tophalf)))[
-                       0] * 100
+            z = self.raw_points[:, 1]
+            i = (len(z) - 1) // 2
+            z_tophalf = z[:i + 1]
+            z_bothalf = z[i:][::-1][:i + 1]  # reversed such that x matches the top half
+            return float((z_tophalf - z_bothalf).max()) * 100
         else:
             return 1
 
     @Attribute
     def points(self):
         """Returns scaled list of points"""
-        with open(os.path.join(AIRFOIL_DIR, self.airfoil_name + '.dat'), 'r') as f:
-            point_lst = []
-            for line in f:
-                x, z = line.split(' ', 1)
-                point_lst.append(self.position.translate(
-                    "x", float(x) * self.chord,
-                    "z", float(z) * self.chord * (self.tc / self.tc_airfoildata)
-                ))
-        return point_lst
+        xs = self.raw_points[:, 0] * self.chord
+        zs = self.raw_points[:, 1] * (self.chord * (self.tc / self.tc_airfoildata))
+        return [self.position.translate("x", x, "z", z) for x, z in zip(xs.tolist(), zs.tolist())]
 
 
 if __name__ == '__main__':
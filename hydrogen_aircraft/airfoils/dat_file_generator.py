@@ -1,3 +1,4 @@
+import numpy as np
 from kbeutils.geom import *
 
 airfoil_code = '0015'
@@ -11,13 +12,8 @@ else:
 
 filename = 'NACA' + str(airfoil_code) + '.dat'
 
-points_list = []
-for i in range(len(airfoil)):
-    points_list.append([round(airfoil[i][0], 5), round(airfoil[i][2], 5)])
+points = np.asarray(airfoil)[:, [0, 2]]
 
-print(points_list)
+print(points)
 
-with open(filename, 'w') as output:
-    for j in range(len(points_list)):
-        my_str = str(points_list[j][0]) + ' ' + str(points_list[j][1])
-        output.write(my_str + '\n')
+np.savetxt(filename, points, fmt='%.5f', delimiter=' ')
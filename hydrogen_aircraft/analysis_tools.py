@@ -1,9 +1,9 @@
 import numpy as np
 import math
-import matplotlib.pyplot as plt
-from scipy.optimize import minimize_scalar
+from bisect import bisect_left
+from functools import lru_cache
+from scipy.optimize import minimize_scalar, brentq
 import os
-from datetime import *
 
 # lookup table of reference aircraft
 aircraft_data = {'A320': {'payload_range_x': [0, 3800, 6150, 7600],
@@ -26,6 +26,42 @@ aircraft_data = {'A320': {'payload_range_x': [0, 3800, 6150, 7600],
                           'payload_range_y': [14.7, 14.7, 9, 0]}
                  }
 
+# store the reference curves as arrays so they can be passed to numpy without conversion
+aircraft_data = {aircraft: {key: np.asarray(values) for key, values in data.items()}
+                 for aircraft, data in aircraft_data.items()}
+
+
+# ISA layers: base altitude [m], base temperature [K], base pressure [Pa] and lapse rate [K/m]
+_isa_h0 = np.array([0., 11000., 20000., 32000., 47000., 51000., 71000.])
+_isa_t0 = np.array([288.15, 216.65, 216.65, 228.650, 270.65, 270.65, 214.65])
+_isa_p0 = np.array([101325.0, 22632.1, 5474.89, 868.019, 110.906, 66.9389, 3.95642])
+_isa_lapse_rate = np.array([-0.0065, 0.0, +0.001, +0.0028, 0.0, -0.0028, -0.002])
+_isa_h_max = 86000.  # [m]
+_isa_h0_list = _isa_h0.tolist()
+
+
+@lru_cache(maxsize=256)
+def _isa_scalar(h1):
+    """ Scalar version of isa_calculator using the math module, avoids numpy dispatch for single
+    altitudes. Returns a tuple such that the cached result cannot be modified. """
+
+    g0 = 9.80665  # [m/s]
+    R = 287.0  # [J/kgK]
+
+    if h1 > _isa_h_max:
+        raise ValueError(f'ISA calculator is only valid up to {_isa_h_max} m')
+    i = min(max(bisect_left(_isa_h0_list, h1) - 1, 0), len(_isa_h0_list) - 1)
+    a = float(_isa_lapse_rate[i])
+    t0_k = float(_isa_t0[i])
+    p0 = float(_isa_p0[i])
+    h0 = _isa_h0_list[i]
+    t1_k = t0_k + (a * (h1 - h0))
+    if a == 0:
+        p1_pa = p0 * math.exp((-g0 / (t1_k * R)) * (h1 - h0))
+    else:
+        p1_pa = p0 * (t1_k / t0_k) ** (-g0 / (a * R))
+    return t1_k, p1_pa, p1_pa / (R * t1_k)
+
 
 def isa_calculator(h1):
     """
@@ -33,7 +69,7 @@ def isa_calculator(h1):
 
     Parameters
     ----------
-    h1 : float
+    h1 : float or numpy.ndarray
         altitude in [m]
 
     Returns
@@ -42,87 +78,88 @@ def isa_calculator(h1):
         t1 in [K]
         p1 in [Pa]
         d1 in [kg/m3]
+        Floats if h1 is a float, else arrays of the same shape as h1
     """
 
+    if isinstance(h1, (int, float)):
+        # scalar altitudes are cached, as the same (cruise) altitude is requested repeatedly
+        return list(_isa_scalar(float(h1)))
+
     g0 = 9.80665  # [m/s]
     R = 287.0  # [J/kgK]
-    tsea = 288.15  # [K]
-    psea = 101325.0  # [Pa]
-    dsea = 1.2250  # [kg/m3]
-
-    if h1 <= 11000:
-        a = -0.0065
-        t0_k = 288.15  # kelvin
-        p0 = 101325.0  # pa
-        d0 = 1.2250
-        h0 = 0  # m
-    elif 11000 < h1 <= 20000:
-        a = 0.0
-        t0_k = 216.65  # kelvin
-        p0 = 22632.1  # pa
-        d0 = 0.363918
-        h0 = 11000  # m
-    elif 20000 < h1 <= 32000:
-        a = +0.001
-        t0_k = 216.65  # kelvin
-        p0 = 5474.89  # pa
-        d0 = 0.0880349
-        h0 = 20000  # m
-    elif 32000 < h1 <= 47000:
-        a = +0.0028
-        t0_k = 228.650  # kelvin
-        p0 = 868.019  # pa
-        d0 = 0.0132250
-        h0 = 32000  # m
-    elif 47000 < h1 <= 51000:
-        a = 0.0
-        t0_k = 270.65  # kelvin
-        p0 = 110.906  # pa
-        d0 = 0.00142753
-        h0 = 47000  # m
-    elif 51000 < h1 <= 71000:
-        a = -0.0028
-        t0_k = 270.65  # kelvin
-        p0 = 66.9389  # pa
-        d0 = 0.000861606
-        h0 = 51000  # m
-    elif 71000 < h1 <= 86000:
-        a = -0.002
-        t0_k = 214.65  # kelvin
-        p0 = 3.95642  # pa
-        d0 = 0.0000642110
-        h0 = 71000  # m
-    else:
-        print("ERROR: too high")
-
-    if a == 0:
-        t1_k = t0_k + (a * (h1 - h0))
-        p1_pa = p0 * math.e ** ((-g0 / (t1_k * R)) * (h1 - h0))
-        d1 = p1_pa / (R * t1_k)
-    else:
-        t1_k = t0_k + (a * (h1 - h0))
-        p1_pa = p0 * (t1_k / t0_k) ** (-g0 / (a * R))
-        d1 = p1_pa / (R * t1_k)
 
+    h1 = np.asarray(h1, dtype=np.float64)
+    if np.any(h1 > _isa_h_max):
+        raise ValueError(f'ISA calculator is only valid up to {_isa_h_max} m')
+
+    # the layer boundaries belong to the lower layer, eg. 11000 m is still in the troposphere
+    idx = np.clip(np.searchsorted(_isa_h0, h1, side='left') - 1, 0, len(_isa_h0) - 1)
+    a = _isa_lapse_rate[idx]
+    t0_k = _isa_t0[idx]
+    p0 = _isa_p0[idx]
+    h0 = _isa_h0[idx]
+
+    isothermal = a == 0
+    a_gradient = np.where(isothermal, 1., a)  # avoids division by zero in isothermal layers
+    t1_k = t0_k + (a * (h1 - h0))
+    p1_pa = np.where(isothermal,
+                     p0 * np.exp((-g0 / (t1_k * R)) * (h1 - h0)),
+                     p0 * (t1_k / t0_k) ** (-g0 / (a_gradient * R)))
+    d1 = p1_pa / (R * t1_k)
+
+    if h1.ndim == 0:
+        return [float(t1_k), float(p1_pa), float(d1)]
     return [t1_k, p1_pa, d1]
 
 
 def range_equation(fuel_mass, maximum_takeoff_mass, reserve_fuel_percentage,
                    fuel_fractions_hydrogen, cruise_mach_number, cruise_speed_of_sound, tsfc,
                    lift_to_drag):
-    """ Calculate range that can be obtained for a given fuel mass of hydrogen """
+    """ Calculate range that can be obtained for a given fuel mass of hydrogen. The fuel mass (and
+    maximum take-off mass) may be arrays, in which case an array of ranges is returned. """
+    fuel_mass = np.asarray(fuel_mass, dtype=np.float64)
+    fuel_fraction_product = np.prod(fuel_fractions_hydrogen)  # independent of the fuel mass
     total_fuel_fraction = 1 - fuel_mass / (maximum_takeoff_mass
                                            * (1 + reserve_fuel_percentage / 100))
-    W5W4 = total_fuel_fraction / np.prod(fuel_fractions_hydrogen)
-    return cruise_mach_number * cruise_speed_of_sound / tsfc * lift_to_drag * np.log(1 / W5W4)
+    W5W4 = total_fuel_fraction / fuel_fraction_product
+    return -cruise_mach_number * cruise_speed_of_sound / tsfc * lift_to_drag * np.log(W5W4)
+
+
+def range_sweep(fuel_mass, payload_masses, max_payload_mass, maximum_takeoff_mass,
+                ferry_takeoff_mass, reserve_fuel_percentage, fuel_fractions_hydrogen,
+                cruise_mach_number, cruise_speed_of_sound, tsfc, lift_to_drag):
+    """ Calculate the range for an array of payload masses at a constant fuel mass. The take-off
+    mass is interpolated linearly between the ferry take-off mass (no payload) and the maximum
+    take-off mass (max_payload_mass), so the end points match the ferry and maximum payload
+    ranges. """
+    payload_masses = np.asarray(payload_masses, dtype=np.float64)
+    if max_payload_mass > 0:
+        payload_ratio = payload_masses / max_payload_mass
+    else:
+        payload_ratio = np.zeros_like(payload_masses)
+    takeoff_masses = ferry_takeoff_mass + payload_ratio * (maximum_takeoff_mass
+                                                           - ferry_takeoff_mass)
+    return range_equation(fuel_mass, takeoff_masses, reserve_fuel_percentage,
+                          fuel_fractions_hydrogen, cruise_mach_number, cruise_speed_of_sound,
+                          tsfc, lift_to_drag)
 
 
 def create_payload_range_diagram(max_payload_range, max_payload_mass, ferry_range,
-                                 comparison_aircraft):
-    """ Plot payload-range diagram and compare it to a reference aircraft """
+                                 comparison_aircraft, payload_range_curve=None):
+    """ Plot payload-range diagram and compare it to a reference aircraft. If given, the
+    payload_range_curve (ranges [m], payload masses [kg]) replaces the straight line between the
+    maximum payload and ferry range points. """
+
+    import matplotlib.pyplot as plt
+    from datetime import datetime
 
     payload_pts = [max_payload_mass / 1000, max_payload_mass / 1000, 0]
     range_pts = [0, max_payload_range / 1000, ferry_range / 1000]
+    if payload_range_curve is not None:
+        curve_ranges, curve_payloads = payload_range_curve
+        payload_pts = np.concatenate(([max_payload_mass / 1000],
+                                      np.asarray(curve_payloads) / 1000))
+        range_pts = np.concatenate(([0], np.asarray(curve_ranges) / 1000))
 
     fig, ax = plt.subplots()
     ax.plot(range_pts, payload_pts, color='tab:blue', linestyle='solid', label='H2 Aircraft')
@@ -139,9 +176,9 @@ def create_payload_range_diagram(max_payload_range, max_payload_mass, ferry_rang
     user_response = messagebox.askyesno('Save diagram',
                                         'Do you want to save the payload-range diagram?')
     if user_response:
-        DIR_output = os.getcwd() + '\\output\\'
-        fname = DIR_output + 'Airbus_A320_payload_range_diagram_' + '{date:%Y-%m-%d_%H%M%S}'.format(
-            date=datetime.now()) + '.pdf'
+        timestamp = datetime.now().strftime('%Y-%m-%d_%H%M%S')
+        fname = os.path.join(os.getcwd(), 'output',
+                             f'Airbus_A320_payload_range_diagram_{timestamp}.pdf')
         plt.savefig(fname)
 
     plt.show()
@@ -153,14 +190,14 @@ def create_loading_diagram():
 
     def potato_slice(weight_positions, weights, initial_xcg, initial_weight):
         """ Calculate single slice of the potato diagram based on weights and their position."""
-        xcg_positions = [initial_xcg]
-        aircraft_weight = [initial_weight]
-        for xi, wi in zip(weight_positions, weights):
-            sum_moments = xcg_positions[-1] * aircraft_weight[-1] + xi * wi
-            sum_weights = aircraft_weight[-1] + wi
-            aircraft_weight.append(sum_weights)
-            xcg_positions.append(sum_moments / sum_weights)
-        return xcg_positions, aircraft_weight
+        weights = np.asarray(weights, dtype=np.float64)
+        weight_positions = np.asarray(weight_positions, dtype=np.float64)
+        initial_moment = initial_xcg * initial_weight
+        aircraft_weight = np.concatenate(([initial_weight], initial_weight + np.cumsum(weights)))
+        sum_moments = np.concatenate(([initial_moment],
+                                      initial_moment + np.cumsum(weight_positions * weights)))
+        xcg_positions = sum_moments / aircraft_weight
+        return xcg_positions.tolist(), aircraft_weight.tolist()
 
     # start at OEW
     # add fwd and aft cargo
@@ -171,6 +208,149 @@ def create_loading_diagram():
     return
 
 
+def _turbofan_cold_section(mach, Ta, Pa, v_inf, mdot_cor, BPR, Pr_fan, Pr_LPC, Pr_HPC, Pr_inlet,
+                           isen_fan, isen_lpc, isen_hpc, eta_nozzle):
+    """
+    Evaluates the part of the turbofan cycle that does not depend on the combustion chamber exit
+    temperature: inlet, fan, LPC, HPC and bypass nozzle. See aero_engine_code for a description
+    of the inputs.
+
+    Returns
+    -------
+    dict
+        Quantities required by _turbofan_hot_section
+    """
+
+    # Constants
+    R = 287  # [J/kgK]
+    Pref = 101325  # [Pa]
+    Tref = 288  # [K]
+    cp_air = 1000  # [J/kgK]
+    kappa_air = 1.4  # [-]
+
+    # Ambient
+    Ta_tot = Ta * (1 + ((kappa_air - 1) / 2) * mach ** 2)
+    Pa_tot = Pa * (1 + ((kappa_air - 1) / 2) * mach ** 2) ** (kappa_air / (kappa_air - 1))
+
+    # Station 2
+    T02 = Ta_tot
+    P02 = Pa_tot * Pr_inlet
+
+    # Obtaining real mass flow from corrected
+    delta = Pa_tot / Pref
+    theta = Ta_tot / Tref
+    mdot = mdot_cor / (np.sqrt(theta) / delta)
+
+    # mdot to core and bypass
+    mdot_core = mdot / (BPR + 1)
+    mdot_bypass = mdot_core * BPR
+
+    # Fan
+    P021 = Pr_fan * P02
+    P013 = P021
+    T021 = T02 * (1 + (1 / isen_fan) * ((P021 / P02) ** ((kappa_air - 1) / kappa_air) - 1))
+    T013 = T021
+    Wfan_req = mdot * cp_air * (T021 - T02)  # in W
+
+    # LPC
+    P025 = Pr_LPC * P021
+    T025 = T021 * (1 + (1 / isen_lpc) * ((P025 / P021) ** ((kappa_air - 1) / kappa_air) - 1))
+    WLPC_req = mdot_core * cp_air * (T025 - T021)  # in W
+
+    # Bypass nozzle calculations
+    P016 = P013
+    T016 = T013
+    crit_press_noz_bypass = (1 - (1 / eta_nozzle) * ((kappa_air - 1) / (kappa_air + 1))) ** (
+            -kappa_air / (kappa_air - 1))
+    if (P016 / Pa) > crit_press_noz_bypass:
+        T018 = T016 * (2 / (kappa_air + 1))
+        P018 = P016 / crit_press_noz_bypass
+        v18 = np.sqrt(kappa_air * R * T018)
+        rho18 = P018 / (R * T018)
+        A18 = mdot_bypass / (rho18 * v18)
+        F_bypass = mdot_bypass * (v18 - v_inf) + A18 * (P018 - Pa)
+    else:
+        P018 = Pa
+        T018 = T016 * (1 + (1 / eta_nozzle) * (
+                (P018 / P016) ** ((kappa_air - 1) / kappa_air) - 1))
+        v18 = np.sqrt(2 * cp_air * (T016 - T018))
+        F_bypass = mdot_bypass * (v18 - v_inf)
+
+    # HPC
+    P03 = Pr_HPC * P025
+    T03 = T025 * (1. + (1. / isen_hpc) * (Pr_HPC ** ((kappa_air - 1.) / kappa_air) - 1.))
+    WHPC_req = mdot_core * cp_air * (T03 - T025)
+
+    return {'Pa': Pa, 'v_inf': v_inf, 'mdot_core': mdot_core, 'P03': P03, 'T03': T03,
+            'WHPC_req': WHPC_req, 'WLPC_req': WLPC_req, 'Wfan_req': Wfan_req,
+            'F_bypass': F_bypass}
+
+
+def _turbofan_hot_section(T04, cold_section, lhv, Pr_comb, isen_lpt, isen_hpt, eta_mech,
+                          eta_comb, eta_nozzle):
+    """
+    Evaluates the combustion chamber, turbines and core nozzle for a given combustion chamber
+    exit temperature. See aero_engine_code for a description of the inputs.
+
+    Returns
+    -------
+    [SFC, mdot_f, T04, F_N_cal]
+        SFC in [g/kNs]
+        mdot_f in [kg/s]
+        T04 in [K]
+        F_N_cal in [N]
+    """
+
+    # Constants
+    R = 287  # [J/kgK]
+    cp_gas = 1150  # [J/kgK]
+    kappa_gas = 1.33  # [-]
+
+    Pa = cold_section['Pa']
+    v_inf = cold_section['v_inf']
+    mdot_core = cold_section['mdot_core']
+
+    # Combustion chamber
+    mdot_f = (mdot_core * cp_gas * (T04 - cold_section['T03'])) / (eta_comb * (lhv * (10 ** 6)))
+    mdot_corefuel = mdot_core + mdot_f
+    P04 = Pr_comb * cold_section['P03']
+
+    # HPT
+    WHPT = cold_section['WHPC_req'] / eta_mech
+    T045 = -1. * ((WHPT / (mdot_corefuel * cp_gas)) - T04)
+    P045 = P04 * ((((T045 / T04) - 1. + isen_hpt) / isen_hpt) ** (kappa_gas / (kappa_gas -
+                                                                               1.)))
+
+    # LPT
+    WLPT = (cold_section['WLPC_req'] + cold_section['Wfan_req']) / eta_mech
+    T05 = -1. * ((WLPT / (cp_gas * mdot_corefuel)) - T045)
+    P05 = P045 * ((((T05 / T045) - 1. + isen_lpt) / isen_lpt) ** (kappa_gas / (kappa_gas - 1)))
+
+    # Core nozzle
+    P07 = P05
+    T07 = T05
+    crit_press_noz_core = (1 - (1 / eta_nozzle) * ((kappa_gas - 1) / (kappa_gas + 1))) ** (
+            -kappa_gas / (kappa_gas - 1))
+    if (P07 / Pa) > crit_press_noz_core:
+        T08 = T07 * (2 / (kappa_gas + 1))
+        P08 = P07 / crit_press_noz_core
+        v8 = np.sqrt(kappa_gas * R * T08)
+        rho8 = P08 / (R * T08)
+        A8 = mdot_corefuel / (rho8 * v8)
+        F_core = mdot_corefuel * (v8 - v_inf) + A8 * (P08 - Pa)
+    else:
+        P08 = Pa
+        T08 = T07 * (1 + (1 / eta_nozzle) * ((P08 / P07) ** ((kappa_gas - 1) / kappa_gas) - 1))
+        v8 = np.sqrt(2 * cp_gas * (T07 - T08))
+        F_core = mdot_corefuel * (v8 - v_inf)
+
+    # Thrust
+    F_N_cal = F_core + cold_section['F_bypass']  # N
+    SFC = mdot_f / (F_N_cal / 1000)  # kg/s / kN
+
+    return [SFC / 1000, mdot_f, T04, F_N_cal]
+
+
 def aero_engine_code(mach, altitude, lhv, thrust, mdot_cor, BPR, max_T04,
                      Pr_fan, Pr_LPC, Pr_HPC, Pr_comb, Pr_inlet,
                      isen_fan, isen_lpc, isen_hpc, isen_lpt, isen_hpt,
@@ -210,127 +390,74 @@ def aero_engine_code(mach, altitude, lhv, thrust, mdot_cor, BPR, max_T04,
 
     # Constants
     R = 287  # [J/kgK]
-    Pref = 101325  # [Pa]
-    Tref = 288  # [K]
-    cp_air = 1000  # [J/kgK]
     kappa_air = 1.4  # [-]
-    cp_gas = 1150  # [J/kgK]
-    kappa_gas = 1.33  # [-]
 
     # calculate ambient conditions
     [Ta, Pa, _] = isa_calculator(altitude)
     v_inf = mach * np.sqrt(kappa_air * R * Ta)
 
-    out = []
-
-    def min_func(T04):
-        # Ambient
-        Ta_tot = Ta * (1 + ((kappa_air - 1) / 2) * mach ** 2)
-        Pa_tot = Pa * (1 + ((kappa_air - 1) / 2) * mach ** 2) ** (kappa_air / (kappa_air - 1))
-
-        # Station 2
-        T02 = Ta_tot
-        P02 = Pa_tot * Pr_inlet
-
-        # Obtaining real mass flow from corrected
-        delta = Pa_tot / Pref
-        theta = Ta_tot / Tref
-        mdot = mdot_cor / (np.sqrt(theta) / delta)
-
-        # mdot to core and bypass
-        mdot_core = mdot / (BPR + 1)
-        mdot_bypass = mdot_core * BPR
-
-        # Fan
-        P021 = Pr_fan * P02
-        P013 = P021
-        T021 = T02 * (1 + (1 / isen_fan) * ((P021 / P02) ** ((kappa_air - 1) / kappa_air) - 1))
-        T013 = T021
-        Wfan_req = mdot * cp_air * (T021 - T02)  # in W
-        Wfancore = mdot_core * cp_air * (T021 - T02)
-
-        # LPC
-        P025 = Pr_LPC * P021
-        T025 = T021 * (1 + (1 / isen_lpc) * ((P025 / P021) ** ((kappa_air - 1) / kappa_air) - 1))
-        WLPC_req = mdot_core * cp_air * (T025 - T021)  # in W
-
-        # Bypass nozzle calculations
-        P016 = P013
-        T016 = T013
-        crit_press_noz_bypass = (1 - (1 / eta_nozzle) * ((kappa_air - 1) / (kappa_air + 1))) ** (
-                -kappa_air / (kappa_air - 1))
-        if (P016 / Pa) > crit_press_noz_bypass:
-            T018 = T016 * (2 / (kappa_air + 1))
-            P018 = P016 / crit_press_noz_bypass
-            v18 = np.sqrt(kappa_air * R * T018)
-            rho18 = P018 / (R * T018)
-            A18 = mdot_bypass / (rho18 * v18)
-            F_bypass = mdot_bypass * (v18 - v_inf) + A18 * (P018 - Pa)
-            v18eq = (F_bypass / mdot_bypass) + v_inf
-        else:
-            P018 = Pa
-            T018 = T016 * (1 + (1 / eta_nozzle) * (
-                    (P018 / P016) ** ((kappa_air - 1) / kappa_air) - 1))
-            v18 = np.sqrt(2 * cp_air * (T016 - T018))
-            F_bypass = mdot_bypass * (v18 - v_inf)
-            v18eq = v18
-
-        # HPC
-        P03 = Pr_HPC * P025
-        T03 = T025 * (1. + (1. / isen_hpc) * (Pr_HPC ** ((kappa_air - 1.) / kappa_air) - 1.))
-        WHPC_req = mdot_core * cp_air * (T03 - T025)
-
-        # Combustion chamber
-        mdot_f = (mdot_core * cp_gas * (T04 - T03)) / (eta_comb * (lhv * (10 ** 6)))  # kg/s
-        mdot_corefuel = mdot_core + mdot_f
-        P04 = Pr_comb * P03
-
-        # HPT
-        WHPT = WHPC_req / eta_mech
-        T045 = -1. * ((WHPT / (mdot_corefuel * cp_gas)) - T04)
-        P045 = P04 * ((((T045 / T04) - 1. + isen_hpt) / isen_hpt) ** (kappa_gas / (kappa_gas -
-                                                                                   1.)))
-
-        # LPT
-        WLPT = (WLPC_req + Wfan_req) / eta_mech
-        T05 = -1. * ((WLPT / (cp_gas * mdot_corefuel)) - T045)
-        P05 = P045 * ((((T05 / T045) - 1. + isen_lpt) / isen_lpt) ** (kappa_gas / (kappa_gas - 1)))
-
-        # Core nozzle
-        P07 = P05
-        T07 = T05
-        crit_press_noz_core = (1 - (1 / eta_nozzle) * ((kappa_gas - 1) / (kappa_gas + 1))) ** (
-                -kappa_gas / (kappa_gas - 1))
-        if (P07 / Pa) > crit_press_noz_core:
-            T08 = T07 * (2 / (kappa_gas + 1))
-            P08 = P07 / crit_press_noz_core
-            v8 = np.sqrt(kappa_gas * R * T08)
-            rho8 = P08 / (R * T08)
-            A8 = mdot_corefuel / (rho8 * v8)
-            F_core = mdot_corefuel * (v8 - v_inf) + A8 * (P08 - Pa)
-            v8eq = (F_core / mdot_core) + v_inf
-        else:
-            P08 = Pa
-            T08 = T07 * (1 + (1 / eta_nozzle) * ((P08 / P07) ** ((kappa_gas - 1) / kappa_gas) - 1))
-            v8 = np.sqrt(2 * cp_gas * (T07 - T08))
-            F_core = mdot_corefuel * (v8 - v_inf)
-            v8eq = v8
-
-        # Thrust
-        F_N_cal = F_core + F_bypass  # N
-        SFC = mdot_f / (F_N_cal / 1000)  # kg/s / kN
-
-        out.append([SFC / 1000, mdot_f, T04, F_N_cal])
-
-        diff = abs(F_N_req - F_N_cal)
-
-        return diff
-
-    res = minimize_scalar(min_func, bounds=(1000, 3000), method='bounded')
-    # print('Exited with difference of: ' + str(abs(F_N_req - out[-1][-1])))
-    # print('TIT: ' + str(res.x))
-
-    return out[-1]
+    # the inlet, fan, compressors and bypass nozzle do not depend on T04 and are evaluated once
+    cold_section = _turbofan_cold_section(mach, Ta, Pa, v_inf, mdot_cor, BPR, Pr_fan, Pr_LPC,
+                                          Pr_HPC, Pr_inlet, isen_fan, isen_lpc, isen_hpc,
+                                          eta_nozzle)
+    hot_section_inputs = dict(cold_section=cold_section, lhv=lhv, Pr_comb=Pr_comb,
+                              isen_lpt=isen_lpt, isen_hpt=isen_hpt, eta_mech=eta_mech,
+                              eta_comb=eta_comb, eta_nozzle=eta_nozzle)
+
+    def thrust_residual(T04):
+        return _turbofan_hot_section(T04, **hot_section_inputs)[3] - F_N_req
+
+    # the calculated thrust increases monotonically with T04, so the required thrust is found
+    # by root finding. If it cannot be reached within the bounds, get as close as possible.
+    try:
+        T04 = brentq(thrust_residual, 1000, 3000, xtol=1e-3)
+    except ValueError:
+        T04 = minimize_scalar(lambda T: abs(thrust_residual(T)), bounds=(1000, 3000),
+                              method='bounded').x
+
+    # evaluate the cycle once more at the converged temperature to obtain all outputs
+    return _turbofan_hot_section(T04, **hot_section_inputs)
+
+
+# Weight inputs taken from Figure 42.25 on page 581 of the book Aerodynamic Design of Transport
+# Aircraft by E. Obert, ISBN:978-1-58603-970-7 unless indicated otherwise
+_w_mainwing = 8801  # [kg]
+_w_fuselage = 8938  # [kg]
+_w_horztail = 625  # [kg]
+_w_verttail = 463  # [kg]
+_w_landinggear = 2275  # [kg] includes both the nose and main landing gear
+_w_pylons = 907  # [kg]
+_w_engines = 6621  # [kg]
+_w_bleedairsys = 249  # [kg]
+_w_enginecontrols = 29  # [kg]
+_w_fuelsys = 299  # [kg]
+_w_apu = 223  # [kg]
+_w_hydraulicgen = 547  # [kg]
+_w_hydraulicdist = 319  # [kg]
+_w_aircon = 664  # [kg]
+_w_autopilot = 101  # [kg]
+_w_navsys = 415  # [kg]
+_w_comms = 186  # [kg]
+_w_electricgen = 343  # [kg]
+_w_electricdist = 1032  # [kg]
+_w_flightcontrol = 772  # [kg]
+_w_person = 90  # [kg]
+_w_seat_pilot = 60  # [kg]
+_w_seat_firstclass = 10  # [kg]
+_w_seat_economy = 11  # [kg] https://www.flightglobal.com/new-lufthansa-seat-saves-nearly-30-in
+# -weight/97485.article
+_w_cargocontainer = 274  # [kg] https://vrr.aero/products/akh-container/
+_cargo_weight_density = 161  # [kg/m3] https://www.icao.int/Meetings/STA10/Documents
+# /Sta10_Wp005_en.pdf
+_w_extra = 103 + 200 + 79 + 85 + 30 + 3215  # [kg]
+
+# Derived weights of components that are grouped in the c.g. analysis
+_w_mainlandinggear = 0.85 * _w_landinggear  # [kg] MLG weight taken from Torenbeek
+_w_noselandinggear = 0.15 * _w_landinggear  # [kg] NLG weight taken from Torenbeek
+_w_hydraulics = _w_hydraulicgen + _w_hydraulicdist  # [kg]
+_w_pilots = 2 * (_w_person + _w_seat_pilot)  # [kg]
+_w_pax_firstclass = _w_person + _w_seat_firstclass  # [kg]
+_w_pax_economy = _w_person + _w_seat_economy  # [kg]
 
 
 def center_of_gravity_x(mainwing_cog_x, horztail_cog_x, verttail_cog_x, fuselage_cog_x,
@@ -344,8 +471,9 @@ def center_of_gravity_x(mainwing_cog_x, horztail_cog_x, verttail_cog_x, fuselage
 
     Parameters
     ----------
-    X_cog_x : float
-        The x c.g. position of the X component in [m] measured from the nose of the aircraft
+    X_cog_x : float or numpy.ndarray
+        The x c.g. position of the X component in [m] measured from the nose of the aircraft.
+        Seat rows and cargo containers are given as arrays with one entry per row or container
     w_tank1 : float
         The weight of fuel in and structure f tank 1 in [kg]
 
@@ -359,90 +487,59 @@ def center_of_gravity_x(mainwing_cog_x, horztail_cog_x, verttail_cog_x, fuselage
 
     # TODO: change docstring
 
-    # Weight inputs taken from Figure 42.25 on page 581 of the book Aerodynamic Design of Transport
-    # Aircraft by E. Obert, ISBN:978-1-58603-970-7 unless indicated otherwise
-    w_mainwing = 8801  # [kg]
-    w_fuselage = 8938  # [kg]
-    w_horztail = 625  # [kg]
-    w_verttail = 463  # [kg]
-    w_landinggear = 2275  # [kg] includes both the nose and main landing gear
-    w_pylons = 907  # [kg]
-    w_engines = 6621  # [kg]
-    w_bleedairsys = 249  # [kg]
-    w_enginecontrols = 29  # [kg]
-    w_fuelsys = 299  # [kg]
-    w_apu = 223  # [kg]
-    w_hydraulicgen = 547  # [kg]
-    w_hydraulicdist = 319  # [kg]
-    w_aircon = 664  # [kg]
-    w_autopilot = 101  # [kg]
-    w_navsys = 415  # [kg]
-    w_comms = 186  # [kg]
-    w_electricgen = 343  # [kg]
-    w_electricdist = 1032  # [kg]
-    w_flightcontrol = 772  # [kg]
-    w_person = 90  # [kg]
-    w_seat_pilot = 60  # [kg]
-    w_seat_firstclass = 10  # [kg]
-    w_seat_economy = 11  # [kg] https://www.flightglobal.com/new-lufthansa-seat-saves-nearly-30-in
-    # -weight/97485.article
-    w_cargocontainer = 274  # [kg] https://vrr.aero/products/akh-container/
-    cargo_weight_density = 161  # [kg/m3] https://www.icao.int/Meetings/STA10/Documents
-    # /Sta10_Wp005_en.pdf
-    w_cargocontainer_payload = cargo_weight_density * cargocontainer_vol  # [kg]
-    w_extra = 103 + 200 + 79 + 85 + 30 + 3215  # [kg]
+    w_cargocontainer_payload = _cargo_weight_density * cargocontainer_vol  # [kg]
 
     # List containing all the weights and locations of the components
-    cog_lst = [[w_mainwing, mainwing_cog_x],
-               [w_horztail, horztail_cog_x],
-               [w_verttail, verttail_cog_x],
-               [w_fuselage, fuselage_cog_x],
-               [w_bleedairsys, mainwing_wingbox_cog_x],
-               [0.85 * w_landinggear, mainwing_wingbox_cog_x],  # MLG weight taken from Torenbeek
-               [0.15 * w_landinggear, nlg_cog_x],  # NLG weight taken from Torenbeek
-               [w_fuelsys, mainwing_wingbox_cog_x],
-               [w_hydraulicgen + w_hydraulicdist, mainwing_wingbox_cog_x],
-               [w_aircon, mainwing_wingbox_cog_x],
-               [w_apu, apu_cog_x],
-               [w_navsys, nosebox_cog_x],
-               [w_comms, nosebox_cog_x],
-               [w_flightcontrol, nosebox_cog_x],
-               [w_electricgen, nosebox_cog_x],
-               [w_electricdist, nosebox_cog_x],
-               [w_autopilot, nosebox_cog_x],
-               [w_engines, engine_cog_x],
-               [w_pylons, pylon_cog_x],
+    cog_lst = [[_w_mainwing, mainwing_cog_x],
+               [_w_horztail, horztail_cog_x],
+               [_w_verttail, verttail_cog_x],
+               [_w_fuselage, fuselage_cog_x],
+               [_w_bleedairsys, mainwing_wingbox_cog_x],
+               [_w_mainlandinggear, mainwing_wingbox_cog_x],
+               [_w_noselandinggear, nlg_cog_x],
+               [_w_fuelsys, mainwing_wingbox_cog_x],
+               [_w_hydraulics, mainwing_wingbox_cog_x],
+               [_w_aircon, mainwing_wingbox_cog_x],
+               [_w_apu, apu_cog_x],
+               [_w_navsys, nosebox_cog_x],
+               [_w_comms, nosebox_cog_x],
+               [_w_flightcontrol, nosebox_cog_x],
+               [_w_electricgen, nosebox_cog_x],
+               [_w_electricdist, nosebox_cog_x],
+               [_w_autopilot, nosebox_cog_x],
+               [_w_engines, engine_cog_x],
+               [_w_pylons, pylon_cog_x],
                [w_tank1 + w_tank1_fuel, tank1_cog_x],
                [w_tank2 + w_tank2_fuel, tank2_cog_x],
-               [2 * (w_person + w_seat_pilot), pilot_cog_x]
+               [_w_pilots, pilot_cog_x]
                ]
 
-    # Adding the first class seats and passengers to cog_lst
-    for j in np.arange(len(firstclassseats_cog_x)):
-        cog_lst.append([n_firstclassseats_row * (w_person + w_seat_firstclass),
-                        firstclassseats_cog_x[j]])
-
-    # Adding the economy class seats and passengers to cog_lst
-    for k in np.arange(len(economyseats_cog_x)):
-        cog_lst.append([n_economyseats_row * (w_person + w_seat_economy), economyseats_cog_x[k]])
-
-    # Adding the cargo containers to cog_lst
-    for m in np.arange(len(cargocontainer_cog_x)):
-        cog_lst.append([w_cargocontainer + w_cargocontainer_payload, cargocontainer_cog_x[m]])
+    # Adding the seats and passengers of both classes and the cargo containers to preallocated
+    # weight and position buffers
+    n_fixed = len(cog_lst)
+    n_firstclass = len(firstclassseats_cog_x)
+    n_economy = len(economyseats_cog_x)
+    n_cargo = len(cargocontainer_cog_x)
+    i_firstclass = n_fixed + n_firstclass
+    i_economy = i_firstclass + n_economy
+    weights = np.empty(i_economy + n_cargo)
+    positions = np.empty(i_economy + n_cargo)
+
+    weights[:n_fixed], positions[:n_fixed] = zip(*cog_lst)
+    weights[n_fixed:i_firstclass] = n_firstclassseats_row * _w_pax_firstclass
+    positions[n_fixed:i_firstclass] = firstclassseats_cog_x
+    weights[i_firstclass:i_economy] = n_economyseats_row * _w_pax_economy
+    positions[i_firstclass:i_economy] = economyseats_cog_x
+    weights[i_economy:] = _w_cargocontainer + w_cargocontainer_payload
+    positions[i_economy:] = cargocontainer_cog_x
 
     # Calculating the x c.g. position
-    moment = 0
-    aircraft_weight = 0
-    for i in range(len(cog_lst)):
-        moment = moment + (cog_lst[i][0] * cog_lst[i][1])
-        aircraft_weight = aircraft_weight + cog_lst[i][0]
-
-    aircraft_cog_x = moment / aircraft_weight
-
-    w_OEM = aircraft_weight + w_enginecontrols + w_extra - \
-            (w_tank1_fuel + w_tank2_fuel + w_person * (len(firstclassseats_cog_x) *
-                                                       n_firstclassseats_row + len(
-                        economyseats_cog_x) * n_economyseats_row) + len(cargocontainer_cog_x) *
-             (w_cargocontainer + w_cargocontainer_payload))
+    aircraft_weight = weights.sum()
+    aircraft_cog_x = float(weights @ positions) / aircraft_weight
+
+    w_OEM = aircraft_weight + _w_enginecontrols + _w_extra - \
+            (w_tank1_fuel + w_tank2_fuel + _w_person * (n_firstclass * n_firstclassseats_row
+                                                        + n_economy * n_economyseats_row)
+             + n_cargo * (_w_cargocontainer + w_cargocontainer_payload))
 
     return [aircraft_cog_x, aircraft_weight, w_OEM]
@@ -17,18 +17,19 @@ class AvlAnalysis(Base):
 
     name = Input('A320', validator=IsInstance(str))
     mach = Input(0.78, validator=Range(0.0, 0.99, incl_min=True, incl_max=True))  # [-]
-    mac = Input(4.1935, validator=Positive() and is_real_number)  # [m]
-    ref_span = Input(35.8, validator=Positive() and is_real_number)  # [m]
-    ref_area = Input(122.6, validator=Positive() and is_real_number)  # [m2]
+    mac = Input(4.1935, validator=And(Positive(), is_real_number))  # [m]
+    ref_span = Input(35.8, validator=And(Positive(), is_real_number))  # [m]
+    ref_area = Input(122.6, validator=And(Positive(), is_real_number))  # [m2]
     ref_point = Input(Point(0, 0, 0))
     cl = Input(0.0, validator=is_real_number)  # [-]
-    cd0 = Input(0.018, validator=is_real_number and Positive())  # [-]
+    cd0 = Input(0.018, validator=And(is_real_number, Positive()))  # [-]
     avl_surfaces = Input()
 
-    @Input
+    @Attribute
     def cruise_case(self):
-        return [('cruise', {'alpha': avl.Parameter(name='alpha', value=self.cl,
-                                                   setting='CL')})]
+        """AVL case name and settings, trimmed to the cruise lift coefficient"""
+        return (('cruise', {'alpha': avl.Parameter(name='alpha', value=self.cl,
+                                                   setting='CL')}),)
 
     @Attribute
     def avl_configuration(self):
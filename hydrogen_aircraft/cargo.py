@@ -1,7 +1,7 @@
 from parapy.core import *
 from parapy.geom import *
 from parapy.core.validate import Positive
-import numpy as np
+import math
 
 
 class CargoContainer(GeomBase):
@@ -30,6 +30,13 @@ class CargoContainer(GeomBase):
     def width(self, value):
         return value > self.base
 
+    # Attributes
+
+    @Attribute
+    def cut_size(self):
+        """Side length of the square boxes cut from the corners (width > base by validator)"""
+        return math.sqrt(0.5) * (self.width - self.base)
+
     # Parts
     # The container is created by subtracting two smaller boxes from a larger one to create the
     # right shape.
@@ -41,16 +48,16 @@ class CargoContainer(GeomBase):
     @Part(in_tree=False)
     def cut_volume_starboard(self):
         return Box(self.depth,
-                   np.sqrt(0.5 * (self.width - self.base) ** 2),
-                   np.sqrt(0.5 * (self.width - self.base) ** 2),
+                   self.cut_size,
+                   self.cut_size,
                    position=rotate(translate(self.position, 'y', 0.5 * (
                        self.width + self.base)), 'x', -45, deg=True))
 
     @Part(in_tree=False)
     def cut_volume_port(self):
         return Box(self.depth,
-                   np.sqrt(0.5 * (self.width - self.base) ** 2),
-                   np.sqrt(0.5 * (self.width - self.base) ** 2),
+                   self.cut_size,
+                   self.cut_size,
                    position=rotate(translate(self.position, 'y', -0.5 * (
                        self.width - self.base)), 'x', -45, deg=True))
 
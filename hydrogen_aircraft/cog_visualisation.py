@@ -32,6 +32,7 @@ class COGVisualisation(GeomBase):
     def cog_x_sphere(self):
         return Sphere(radius=0.2,
                       color=[255, 0, 0],
+                      mesh_deflection=0.01,  # coarse mesh is sufficient for a marker
                       position=translate(self.position,
                                          'x', self.aircraft_cog_x,
                                          'y', -(self.mainwing_span / 2) * 1.2))
@@ -2,106 +2,112 @@ from parapy.core import Input, Attribute, action
 from parapy.geom import GeomBase
 from parapy.core.validate import *
 import xml.etree.ElementTree as ET
-import subprocess, xmltodict
+import subprocess
+import copy
 import numpy as np
 import math as m
 from hydrogen_aircraft import aircraft_data, isa_calculator, aero_engine_code, ENGINE_DIR
 import os
-from datetime import *
+from datetime import datetime
+
+_SQRT_KAPPA_R = m.sqrt(1.4 * 287)  # speed of sound is _SQRT_KAPPA_R * sqrt(T) in [m/s]
+_HALF_KAPPA_M1 = (1.4 - 1) / 2  # (kappa - 1) / 2 for air
+_KAPPA_OVER_KAPPA_M1 = 1.4 / (1.4 - 1)  # kappa / (kappa - 1) for air
+
+# constant element paths in the GSP 11 save file. ElementTree compiles and caches each path the
+# first time it is used, so all lookups use these fixed paths instead of ID-specific ones.
+_GSP_COMPONENTS = 'Components/TGSPcomp'
+_GSP_PARAMETERS = 'CompForm/INumFld'
+_GSP_CONFIGS = 'ReferenceModel/Config'
+_GSP_AMBIENT_CONDITIONS = 'Case/AmbConditions/INumFld'
+
+_gsp_tree_cache = {}  # {path: (modification time, parsed tree)}, see _parse_gsp_savefile
 
 
 # define required functions (outside of parapy class)
-def update_design_parameter(engine_data_dict, parameter, parameter_id, component_id):
+def _index_by_id(elements):
+    """ Map the ID attribute of each element to the element itself. """
+    return {element.get('ID'): element for element in elements}
+
+
+def _parse_gsp_savefile(path):
+    """ Return a fresh copy of the parsed GSP 11 save file at path. One parsed tree is cached per
+    path and replaced when the file is modified, so repeated analyses only copy the tree instead
+    of re-parsing the file. """
+    mtime = os.path.getmtime(path)
+    cached = _gsp_tree_cache.get(path)
+    if cached is None or cached[0] != mtime:
+        cached = _gsp_tree_cache[path] = (mtime, ET.parse(path))
+    return copy.deepcopy(cached[1])
+
+
+def _gsp_model(engine_data, config=None):
+    """ Return the reference model element, or the element of the given configuration. """
+    if config is None:
+        return engine_data.find('ReferenceModel')
+    return _index_by_id(engine_data.iterfind(_GSP_CONFIGS))[config]
+
+
+def index_design_parameters(engine_data, config=None):
     """
-    Update design parameter in GSP 11 save file.
+    Index the design parameters of all components in the GSP 11 reference model, or in one of
+    its configurations, such that repeated updates do not have to search the component and
+    parameter lists.
 
     Parameters
     ----------
-    engine_data_dict : dict
-        Data from GSP xml save file stored as an orderedDict.
-    parameter : float
-        Parameter value to be added to save file.
-    parameter_id : str
-        GSP name of the parameter. For examples, see the gsp_lookup dictionary.
-    component_id : str
-        GSP name of the relevant component. For examples, see the gsp_lookup dictionary.
+    engine_data : xml.etree.ElementTree.Element
+        Root (Project) element of the GSP xml save file.
+    config : str, optional
+        Name of configuration in GSP 11, e.g. 'Config_2'. If None, the components of the
+        reference model are indexed.
 
     Returns
     -------
-    engine_data_dict: collections.OrderedDict
-        Updated input dictionary
+    parameter_index : dict
+        Dictionary {(component_id, parameter_id): INumFld element}
 
     """
+    return {(component.get('ID'), parameter.get('ID')): parameter
+            for component in _gsp_model(engine_data, config).iterfind(_GSP_COMPONENTS)
+            for parameter in component.iterfind(_GSP_PARAMETERS)}
 
-    # define temporary dictionary of data
-    temp_dict = engine_data_dict['Project']['ReferenceModel']['Components']['TGSPcomp']
-
-    # find component and parameter corresponding to input, then replace
-    components_id_list = [i['@ID'] for i in temp_dict]
-    component_index = components_id_list.index(component_id)
-    parameters_id_list = [i['@ID'] for i in temp_dict[component_index]['CompForm']['INumFld']]
-    parameter_index = parameters_id_list.index(parameter_id)
-    temp_dict[component_index]['CompForm']['INumFld'][parameter_index]['Value'] = str(parameter)
 
-    # replace the relevant part of the engine_data_dict with the new temporary dict
-    engine_data_dict['Project']['ReferenceModel']['Components']['TGSPcomp'] = temp_dict
-    return engine_data_dict
-
-
-def update_cruise_thrust(engine_data_dict, parameter, parameter_id, component_id,
-                         config):
+def update_design_parameter(parameter_index, parameter, parameter_id, component_id):
     """
-    Update cruise thrust value in GSP 11 save file.
+    Update design parameter in GSP 11 save file.
 
     Parameters
     ----------
-    engine_data_dict : dict
-        Data from GSP xml save file stored as an orderedDict.
+    parameter_index : dict
+        Index of the GSP design parameters, see index_design_parameters.
     parameter : float
         Parameter value to be added to save file.
     parameter_id : str
         GSP name of the parameter. For examples, see the gsp_lookup dictionary.
     component_id : str
         GSP name of the relevant component. For examples, see the gsp_lookup dictionary.
-    config : str
-        Name of configuration in GSP 11. Currently, choice of 'Config_1' and 'Config_2'. See GSP
-        save file for more details
 
     Returns
     -------
-    engine_data_dict: collections.OrderedDict
-        Updated input dictionary
+    parameter_index: dict
+        Input index, of which the referenced save file element is updated
 
     """
 
-    # find relevant configuration and define temp_dict of the values
-    config_id_list = [i['@ID'] for i in engine_data_dict['Project']['ReferenceModel']['Config']]
-    # TODO: check how many cases there are and act accordingly
-    temp_dict = engine_data_dict['Project']['ReferenceModel']['Config'][
-        config_id_list.index(config)]['Components']['TGSPcomp']
-
     # find component and parameter corresponding to input, then replace
-    components_id_list = [i['@ID'] for i in temp_dict]
-    component_index = components_id_list.index(component_id)
-    parameters_id_list = [i['@ID'] for i in temp_dict[
-        component_index]['CompForm']['INumFld']]
-    parameter_index = parameters_id_list.index(parameter_id)
-    temp_dict[component_index]['CompForm']['INumFld'][parameter_index]['Value'] = str(parameter)
+    parameter_index[component_id, parameter_id].find('Value').text = str(parameter)
+    return parameter_index
 
-    # replace the relevant part of the engine_data_dict with the new temporary dict
-    engine_data_dict['Project']['ReferenceModel']['Config'][
-        config_id_list.index(config)]['Components']['TGSPcomp'] = temp_dict
-    return engine_data_dict
 
-
-def update_cruise_conditions(engine_data_dict, altitude, mach, config):
+def update_cruise_conditions(engine_data, altitude, mach, config):
     """
     Update ambient conditions for cruise.
 
     Parameters
     ----------
-    engine_data_dict : dict
-        Data from GSP xml save file stored as an orderedDict.
+    engine_data : xml.etree.ElementTree.Element
+        Root (Project) element of the GSP xml save file.
     altitude : float
         Cruise altitude [m]
     mach : float
@@ -112,31 +118,25 @@ def update_cruise_conditions(engine_data_dict, altitude, mach, config):
 
     Returns
     -------
-    engine_data_dict: collections.OrderedDict
-        Updated input dictionary
+    engine_data: xml.etree.ElementTree.Element
+        Updated input element
 
     """
 
-    # navigate to correct ambient conditions and define temp_dict
-    config_id_list = [i['@ID'] for i in engine_data_dict['Project']['ReferenceModel']['Config']]
-    temp_dict = engine_data_dict['Project']['ReferenceModel']['Config'][
-        config_id_list.index(config)]['Case']['AmbConditions']['INumFld']
-
     # calculate ambient conditions and save in a dictionary
     Ts, Ps, rho = isa_calculator(altitude)
-    Tt = Ts * (1 + 0.4 / 2 * mach ** 2)
-    Pt = Ps * (Tt / Ts) ** (1.4 / 0.4)
+    Tt = Ts * (1 + _HALF_KAPPA_M1 * mach * mach)
+    Pt = Ps * (Tt / Ts) ** _KAPPA_OVER_KAPPA_M1
     Zp = altitude
-    Vt = mach * m.sqrt(1.4 * 287 * Ts)
+    Vt = mach * _SQRT_KAPPA_R * m.sqrt(Ts)
     conditions = {'Ts': Ts, 'Ps': Ps, 'rho': rho, 'Tt': Tt, 'Pt': Pt, 'Zp': Zp, 'Vt': Vt}
 
-    # replace values and return new dictionary
-    parameter_id_list = [i['@ID'] for i in temp_dict]
-    for parameter in conditions.keys():
-        temp_dict[parameter_id_list.index(parameter)]['Value'] = str(conditions[parameter])
-    engine_data_dict['Project']['ReferenceModel']['Config'][
-        config_id_list.index(config)]['Case']['AmbConditions']['INumFld'] = temp_dict
-    return engine_data_dict
+    # navigate to correct ambient conditions and replace values
+    ambient_conditions = _index_by_id(
+        _gsp_model(engine_data, config).iterfind(_GSP_AMBIENT_CONDITIONS))
+    for parameter, value in conditions.items():
+        ambient_conditions[parameter].find('Value').text = str(value)
+    return engine_data
 
 
 # lookup dictionary with relevant design parameters
@@ -187,7 +187,7 @@ class Turbofan(GeomBase):
 
     # General aircraft inputs (all passed down). Private if not run as main file.
     baseline_aircraft = Input('A320', private=not (__name__ == '__main__'),
-                              validator=OneOf(['A320']))
+                              validator=OneOf(frozenset({'A320'})))
     maximum_takeoff_mass = Input(70000, private=not (__name__ == '__main__'))  # [kg]
     cruise_altitude = Input(12910, private=not (__name__ == '__main__'))  # [m]
     cruise_mach_number = Input(0.78, private=not (__name__ == '__main__'))  # [-]
@@ -212,8 +212,8 @@ class Turbofan(GeomBase):
     def inlet_mdot_cruise(self):
         """ Estimates corrected mass flow through the inlet of the engine in cruise conditions."""
         [T, _, rho] = isa_calculator(self.cruise_altitude)
-        v_inf = self.cruise_mach_number * np.sqrt(1.4 * 287 * T)
-        fan_area = np.pi * (self.fan_diameter / 2) ** 2
+        v_inf = self.cruise_mach_number * _SQRT_KAPPA_R * m.sqrt(T)
+        fan_area = m.pi * (self.fan_diameter / 2) ** 2
         return v_inf * fan_area * rho
 
     bypass_ratio = Input(11.0, validator=Positive())
@@ -286,17 +286,17 @@ class Turbofan(GeomBase):
         """ Update GSP xml save file with new values and load GSP 11.
         """
         path = os.path.join(ENGINE_DIR, self.gsp_savefile_path)
-        data: dict = xmltodict.parse(ET.tostring(ET.parse(path).getroot()))
-        for key in gsp_designpar_lookup:
-            data = update_design_parameter(data, eval('self.' + key),
-                                           gsp_designpar_lookup[key]['gsp_id'],
-                                           gsp_designpar_lookup[key]['component_id'])
-        data = update_cruise_thrust(data, self.cruise_thrust,
-                                    'Input1', 'Thrust Control', 'Config_2')
+        tree = _parse_gsp_savefile(path)
+        data = tree.getroot()
+        parameter_index = index_design_parameters(data)
+        for key, lookup in gsp_designpar_lookup.items():
+            update_design_parameter(parameter_index, getattr(self, key), lookup['gsp_id'],
+                                    lookup['component_id'])
+        update_design_parameter(index_design_parameters(data, 'Config_2'), self.cruise_thrust,
+                                'Input1', 'Thrust Control')
         data = update_cruise_conditions(data, self.cruise_altitude, self.cruise_mach_number,
                                         'Config_2')
-        with open(self.gsp_updated_path, 'w') as result_file:
-            result_file.write(xmltodict.unparse(data))
+        tree.write(self.gsp_updated_path, encoding='utf-8', xml_declaration=True)
         subprocess.Popen("%s %s" % (self.gsp_link, self.gsp_updated_path))
         return
 
@@ -313,7 +313,9 @@ class Turbofan(GeomBase):
         from tkinter import Tk, messagebox
         from tkinter.filedialog import askopenfilename
         import matplotlib
-        matplotlib.use('TKAgg')
+        # switching backends re-initialises matplotlib, and some builds report it in lower case
+        if matplotlib.get_backend().lower() != 'tkagg':
+            matplotlib.use('TkAgg')
         import matplotlib.pyplot as plt
         # import matplotlib
         # matplotlib.use('Qt5Agg')
@@ -352,25 +354,33 @@ class Turbofan(GeomBase):
             return
 
         # open report file and calculate climb rate
-        gsp_data_file = open(gsp_datafile_path, 'r')
-        lines = gsp_data_file.readlines()
-        gsp_data_file.close()
-        del lines[-1]
-        new_gsp_file = open('output/gsp_StSt_edited.txt', 'w')
-        for line in lines:
-            new_gsp_file.write(line)
-        new_gsp_file.close()
-        data = np.loadtxt('output/gsp_StSt_edited.txt', skiprows=8)
+        # the report has eight header lines and a footer line that are skipped
+        with open(gsp_datafile_path, 'r') as gsp_data_file:
+            lines = gsp_data_file.readlines()
+        rows = [line.split() for line in lines[8:-1] if line.strip()]
+        if len({len(row) for row in rows}) > 1:
+            raise ValueError('The rows of GSP report ' + gsp_datafile_path + ' do not all have '
+                             'the same number of columns')
+        data = np.array(rows, dtype=np.float64)
         altitudes = data[:, 1] / 0.3048
         densities = data[:, 2]
         speeds = data[:, 4]
         thrusts = 2 * data[:, 5] * 1000
-        powers = speeds * thrusts  # power = thrust * speed
-        drag = self.zero_lift_drag_coefficient * 0.5 * densities * speeds ** 2 * \
-               self.planform_area + 2 * (self.maximum_takeoff_mass * 9.81) ** 2 / \
-               (np.pi * self.aspect_ratio * self.oswald_efficiency * densities * speeds ** 2 *
-                self.planform_area)
-        climb_rate = (powers - drag * speeds) / (self.maximum_takeoff_mass * 9.81) / 0.3048 * 60
+        weight = self.maximum_takeoff_mass * 9.81
+        induced_drag_factor = weight ** 2 / (np.pi * self.aspect_ratio * self.oswald_efficiency)
+
+        # scalar invariants are folded first and the arrays are updated in place
+        q_S = densities * speeds
+        q_S *= speeds
+        q_S *= 0.5 * self.planform_area  # dynamic pressure * area
+        drag = np.reciprocal(q_S)
+        drag *= induced_drag_factor
+        drag += self.zero_lift_drag_coefficient * q_S
+
+        # excess power = (thrust - drag) * speed, converted to [ft/min]
+        climb_rate = thrusts - drag
+        climb_rate *= speeds
+        climb_rate *= 60 / (weight * 0.3048)
 
         # plot climb rate of aircraft
         fig, ax = plt.subplots()
@@ -380,9 +390,10 @@ class Turbofan(GeomBase):
         comparison_rate_lst = ['climb_rate_high', 'climb_rate_nom']
         label_lst = ['73.5t', '62.0t']
         marker_lst = ['^', 'p']
+        comparison_data = aircraft_data[self.baseline_aircraft]
+        comparison_hts = comparison_data['climb_rate_hts']
         for climb_rate, label, marker in zip(comparison_rate_lst, label_lst, marker_lst):
-            ax.plot(aircraft_data[self.baseline_aircraft]['climb_rate_hts'],
-                    aircraft_data[self.baseline_aircraft][climb_rate],
+            ax.plot(comparison_hts, comparison_data[climb_rate],
                     label=self.baseline_aircraft + ' ' + label, marker=marker, color='tab:red')
         ax.set(xlabel='Altitude [ft]', ylabel='Climb rate [ft/min]')
         ax.set_ylim([0, None])
@@ -390,14 +401,13 @@ class Turbofan(GeomBase):
         fig.tight_layout()
 
         # Save plot to output folder
-        from tkinter import Tk, messagebox
         Tk().withdraw()
         user_response = messagebox.askyesno('Save diagram',
                                             'Do you want to save the climb rate diagram?')
         if user_response:
-            DIR_output = os.getcwd() + '\\output\\'
-            filename_num = '_{date:%Y-%m-%d_%H%M%S}'.format(date=datetime.now())
-            fname = DIR_output + 'Airbus_A320_climb_rate_diagram' + filename_num + '.pdf'
+            timestamp = datetime.now().strftime('%Y-%m-%d_%H%M%S')
+            fname = os.path.join(os.getcwd(), 'output',
+                                 f'Airbus_A320_climb_rate_diagram_{timestamp}.pdf')
             plt.savefig(fname)
 
         plt.show()
@@ -2,8 +2,54 @@ from parapy.core import *
 from parapy.geom import *
 from parapy.core.validate import *
 import numpy as np
+import math
+from collections import namedtuple
 from hydrogen_aircraft import FuselageStructure, Seat, CargoContainer, HydrogenTank
 
+# local x positions of the cabin layout with respect to the start of the cabin [m]
+CabinStations = namedtuple('CabinStations', ['fwd_crossaisle', 'fwd_divider', 'firstclass_seats',
+                                             'class_divider', 'economy_seats', 'aft_divider',
+                                             'aft_toilet', 'aft_crossaisle', 'aft_galley',
+                                             'aft_bulkhead'])
+
+
+def seat_reduction(aisle_width_deficit, aisle_width_per_seat, n_seats):
+    """Smallest number of seats (at most n_seats) to remove from a row to recover the aisle
+    width deficit [m], if every removed seat widens the aisle by aisle_width_per_seat [m]"""
+    if aisle_width_deficit <= 0:
+        return 0
+    return min(math.ceil(aisle_width_deficit / aisle_width_per_seat - 1e-9), n_seats)
+
+
+def remove_seats(n_port, n_starboard, num_reduction):
+    """Remove seats from the side with the most seats first, starting at port if both sides
+    have the same number of seats. Returns the new number of port and starboard seats."""
+    unbalanced = min(num_reduction, abs(n_port - n_starboard))
+    if n_port >= n_starboard:
+        n_port -= unbalanced
+    else:
+        n_starboard -= unbalanced
+    balanced = num_reduction - unbalanced
+    return n_port - (balanced + 1) // 2, n_starboard - balanced // 2
+
+
+def warn_seat_reduction(reported, cabin_class, num_reduction, n_port, n_starboard):
+    """Show a warning dialog that the number of seats in cabin_class has been reduced. reported
+    holds the last reduction shown per cabin class, so the same reduction to the same seat layout
+    is not shown twice while the fuselage is rebuilt."""
+    key = (num_reduction, n_port, n_starboard)
+    if reported.get(cabin_class) == key:
+        return
+    reported[cabin_class] = key
+    from tkinter import Tk, messagebox
+    root = Tk()
+    root.withdraw()
+    messagebox.showwarning('Aisle width too small',
+                           'The aisle width is below its defined minimum. Therefore, the number '
+                           'of ' + cabin_class + ' seats has been reduced by ' +
+                           str(num_reduction), parent=root)
+    root.destroy()
+
 
 class Fuselage(GeomBase):
     """
@@ -60,6 +106,7 @@ class Fuselage(GeomBase):
     # outer geometry variables
     d_outer = Input(4.14)  # [m]
     skin_thickness = Input(0.1, validator=Positive())  # [m]
+    structure_mesh_deflection = Input(1e-3, validator=Positive())  # [m] coarser is faster
 
     @d_outer.validator
     def d_outer(self, value):
@@ -69,6 +116,14 @@ class Fuselage(GeomBase):
     def d_inner(self):
         return self.d_outer - 2 * self.skin_thickness
 
+    @Attribute
+    def r_outer(self):
+        return self.d_outer / 2
+
+    @Attribute
+    def r_inner(self):
+        return self.d_inner / 2
+
     l_fuselage = Input(37.57)  # [m]
     l_nosecone = Input(5.44, validator=Positive())  # [m]
     l_tailcone = Input(13.47, validator=Positive())  # [m]
@@ -116,7 +171,7 @@ class Fuselage(GeomBase):
         """"Position of the start of the fwd cargo hold"""
         return Position(
             location=Point((self.nosebox_end_x * self.l_nosecone) + self.cargo_spacing, 0,
-                           (self.d_inner / 2 - self.cargofloor_height)),
+                           (self.r_inner - self.cargofloor_height)),
             orientation=Orientation(x=Vector(1, 0, 0), y=Vector(0, 1, 0),
                                     z=Vector(0, 0, 1)))
 
@@ -124,32 +179,45 @@ class Fuselage(GeomBase):
     def aft_cargo_start(self):
         """"Position of the start of the aft cargo hold"""
         return Position(location=Point(self.mainwing_wingbox_x_end + self.cargo_spacing, 0,
-                                       (self.d_inner / 2 - self.cargofloor_height)),
+                                       (self.r_inner - self.cargofloor_height)),
                         orientation=Orientation(x=Vector(1, 0, 0), y=Vector(0, 1, 0),
                                                 z=Vector(0, 0, 1)))
 
-    @Attribute(validator=Positive and is_real_number)
+    @Attribute(validator=And(Positive(), is_real_number))
     def l_cargohold_fore(self):
         """Length of the fwd cargo hold [m]"""
         return self.mainwing_wingbox_x_start - self.nosebox_end_x * self.l_nosecone
 
-    @Attribute(validator=Positive and is_real_number)
+    @Attribute(validator=And(Positive(), is_real_number))
     def l_cargohold_aft(self):
         """Length of the aft cargo hold [m]"""
         return min((self.fus_structure.x_cabin_floor_end - self.mainwing_wingbox_x_end),
                    ((self.l_nosecone+self.l_cylindrical) - self.mainwing_wingbox_x_end))
 
-    @Attribute(validator=Positive and IsInstance(int))
+    @Attribute
+    def cargo_container_pitch(self):
+        """Distance between the fronts of consecutive cargo containers [m]"""
+        return self.cargo_container_depth + self.cargo_spacing
+
+    @Attribute(validator=And(IsInstance(int), Positive(incl_zero=True)))
     def n_cargo_containers_fore(self):
         """Number of cargo containers in the fwd cargo hold"""
-        return int(self.l_cargohold_fore / (self.cargo_container_depth +
-                   self.cargo_spacing))
+        return int(self.l_cargohold_fore / self.cargo_container_pitch)
 
-    @Attribute(validator=Positive and IsInstance(int))
+    @Attribute(validator=And(IsInstance(int), Positive(incl_zero=True)))
     def n_cargo_containers_aft(self):
         """Number of cargo containers in the aft cargo hold"""
-        return int(self.l_cargohold_aft / (self.cargo_container_depth +
-                   self.cargo_spacing))
+        return int(self.l_cargohold_aft / self.cargo_container_pitch)
+
+    @Attribute
+    def cargo_x_fore(self):
+        """Local x offsets of the cargo containers from the start of the fwd cargo hold [m]"""
+        return np.arange(self.n_cargo_containers_fore) * self.cargo_container_pitch
+
+    @Attribute
+    def cargo_x_aft(self):
+        """Local x offsets of the cargo containers from the start of the aft cargo hold [m]"""
+        return np.arange(self.n_cargo_containers_aft) * self.cargo_container_pitch
 
     @cargofloor_height.validator  # check that cargo floor is inside fuselage and below cabin
     def cargofloor_height(self, value):
@@ -157,8 +225,8 @@ class Fuselage(GeomBase):
 
     # Wing box and Nose box
     nosebox_end_x = Input(1.2, validator=Positive())  # [-] fraction of l_nosecone
-    mainwing_wingbox_x_start = Input(13, validator=Positive() and is_real_number)  # [m]
-    mainwing_wingbox_x_end = Input(18, validator=Positive() and is_real_number)  # [m]
+    mainwing_wingbox_x_start = Input(13, validator=And(Positive(), is_real_number))  # [m]
+    mainwing_wingbox_x_end = Input(18, validator=And(Positive(), is_real_number))  # [m]
 
     # doors and windows
     door_width_type1 = Input(0.81, validator=GreaterThan(0.7))  # [m]
@@ -178,6 +246,13 @@ class Fuselage(GeomBase):
         distance = self.xcab_aft_toilet - self.xcab_cabin_windows
         return int(distance / self.cabin_window_spacing)
 
+    @Attribute
+    def cabin_window_x_positions(self):
+        """Local x positions of the cabin windows with respect to the start of the cabin"""
+        return (self.xcab_cabin_windows + 0.5 * (self.cabin_window_spacing -
+                                                 self.cabin_window_width) +
+                np.arange(self.n_cabin_windows) * self.cabin_window_spacing)
+
     # hydrogen storage
     n_hydrogen_tanks = Input(2, validator=OneOf([1, 2]))
     aft_limit_hydrogen_tank = Input(0.85)  # [-] multiple of l_fuselage
@@ -196,20 +271,28 @@ class Fuselage(GeomBase):
     def x_cabin(self):
         return self.l_cockpit
 
+    @Attribute
+    def r_inner_squared(self):
+        """Squared inner fuselage radius, shared by the cabin width chords [m^2]"""
+        return self.r_inner ** 2
+
     @Attribute
     def full_cabin_width(self):
-        return 2 * np.sqrt(
-            (self.d_inner / 2) ** 2 - (self.cabinfloor_height - self.d_inner / 2) ** 2)
+        return 2 * math.sqrt(
+            self.r_inner_squared - (self.cabinfloor_height - self.r_inner) ** 2)
 
     @Attribute
     def cabin_width(self):
-        if self.seat_height > 2 * (self.cabinfloor_height - self.d_inner / 2):
-            w_cabin = 2 * np.sqrt((self.d_inner / 2) ** 2 - (self.seat_height -
-                                                             self.cabinfloor_height +
-                                                             self.d_inner / 2) ** 2)
-        else:
-            w_cabin = self.full_cabin_width
-        return w_cabin
+        # the cabin is narrowest at either the floor or the top of the seats, whichever is
+        # furthest from the fuselage centreline
+        floor_offset = self.cabinfloor_height - self.r_inner
+        offset = max(self.seat_height - floor_offset, floor_offset)
+        return 2 * math.sqrt(self.r_inner_squared - offset ** 2)
+
+    @Attribute
+    def reported_seat_reductions(self):
+        """Last seat reduction shown to the user per cabin class, see warn_seat_reduction"""
+        return {}
 
     @Attribute
     def aisle_width_economy(self):
@@ -223,23 +306,20 @@ class Fuselage(GeomBase):
     @aisle_width_economy.on_slot_change
     # TODO: figure out why number is not changing in tree
     def check_economy_aisle(self):
-        num_reduction = 0
-        while self.aisle_width_economy < self.minimum_aisle_width:
-            lst = [self.n_seats_port_economy, self.n_seats_starboard_economy]
-            idx = lst.index(max(lst))
-            if idx == 0:
-                self.n_seats_port_economy -= 1
-            else:
-                self.n_seats_starboard_economy -= 1
-            num_reduction += 1
+        # every removed seat widens the aisle by one seat and armrest width per aisle
+        num_reduction = seat_reduction(self.minimum_aisle_width - self.aisle_width_economy,
+                                       (self.seat_width_economy + self.n_aisles *
+                                        self.armrest_width) / self.n_aisles,
+                                       self.n_seats_port_economy +
+                                       self.n_seats_starboard_economy)
 
         if num_reduction > 0:
-            from tkinter import Tk, messagebox
-            Tk().withdraw()
-            messagebox.showwarning('Aisle width too small',
-                                   'The aisle width is below its defined minimum. Therefore, '
-                                   'the number of economy seats has been reduced by ' + str(
-                                       num_reduction))
+            self.n_seats_port_economy, self.n_seats_starboard_economy = remove_seats(
+                self.n_seats_port_economy, self.n_seats_starboard_economy, num_reduction)
+            warn_seat_reduction(self.reported_seat_reductions, 'economy', num_reduction,
+                                self.n_seats_port_economy, self.n_seats_starboard_economy)
+        else:
+            self.reported_seat_reductions.pop('economy', None)
         return
 
     @Attribute
@@ -254,23 +334,20 @@ class Fuselage(GeomBase):
     @aisle_width_firstclass.on_slot_change
     # TODO: figure out why number is not changing in tree
     def check_firstclass_aisle(self):
-        num_reduction = 0
-        while self.aisle_width_firstclass < self.minimum_aisle_width:
-            lst = [self.n_seats_port_firstclass, self.n_seats_starboard_firstclass]
-            idx = lst.index(max(lst))
-            if idx == 0:
-                self.n_seats_port_firstclass -= 1
-            else:
-                self.n_seats_starboard_firstclass -= 1
-            num_reduction += 1
+        # every removed seat widens the aisle by one seat and armrest width per aisle
+        num_reduction = seat_reduction(self.minimum_aisle_width - self.aisle_width_firstclass,
+                                       (self.seat_width_firstclass + self.n_aisles *
+                                        self.armrest_width) / self.n_aisles,
+                                       self.n_seats_port_firstclass +
+                                       self.n_seats_starboard_firstclass)
 
         if num_reduction > 0:
-            from tkinter import Tk, messagebox
-            Tk().withdraw()
-            messagebox.showwarning('Aisle width too small',
-                                   'The aisle width is below its defined minimum. Therefore, '
-                                   'the number of first class seats has been reduced by ' + str(
-                                       num_reduction))
+            self.n_seats_port_firstclass, self.n_seats_starboard_firstclass = remove_seats(
+                self.n_seats_port_firstclass, self.n_seats_starboard_firstclass, num_reduction)
+            warn_seat_reduction(self.reported_seat_reductions, 'first class', num_reduction,
+                                self.n_seats_port_firstclass, self.n_seats_starboard_firstclass)
+        else:
+            self.reported_seat_reductions.pop('first class', None)
         return
 
     @Attribute
@@ -281,56 +358,132 @@ class Fuselage(GeomBase):
     # xcab is local x position with respect to start of cabin
     # TODO: suppress lengths if certain things do not exist (eg. no first class seating)
 
+    @Attribute
+    def cabin_stations(self):
+        """All xcab positions of the cabin layout, computed in a single pass from front to
+        back. The individual xcab attributes read from this."""
+        fwd_crossaisle = max(self.l_toilet, self.l_galley)
+        fwd_divider = fwd_crossaisle + self.l_cross_aisle
+        firstclass_seats = fwd_divider + self.divider_wall_thickness
+        class_divider = firstclass_seats + self.n_firstclass_rows * self.seat_pitch_firstclass
+        economy_seats = class_divider + self.divider_wall_thickness
+        aft_divider = economy_seats + self.n_economy_rows * self.seat_pitch_economy
+        aft_toilet = aft_divider + self.divider_wall_thickness
+        aft_crossaisle = aft_toilet + self.l_toilet
+        aft_galley = aft_crossaisle + self.l_cross_aisle
+        aft_bulkhead = aft_galley + self.l_galley
+        return CabinStations(fwd_crossaisle, fwd_divider, firstclass_seats, class_divider,
+                             economy_seats, aft_divider, aft_toilet, aft_crossaisle, aft_galley,
+                             aft_bulkhead)
+
     @Attribute
     def xcab_fwd_crossaisle(self):
-        return max([self.l_toilet, self.l_galley])
+        return self.cabin_stations.fwd_crossaisle
 
     @Attribute
     def xcab_fwd_divider(self):
-        return self.xcab_fwd_crossaisle + self.l_cross_aisle
+        return self.cabin_stations.fwd_divider
 
     @Attribute
     def xcab_firstclass_seats(self):
-        return self.xcab_fwd_divider + self.divider_wall_thickness
+        return self.cabin_stations.firstclass_seats
 
     @Attribute
     def xcab_class_divider(self):
-        return self.xcab_firstclass_seats + self.n_firstclass_rows * self.seat_pitch_firstclass
+        return self.cabin_stations.class_divider
 
     @Attribute
     def xcab_economy_seats(self):
-        return self.xcab_class_divider + self.divider_wall_thickness
+        return self.cabin_stations.economy_seats
 
     @Attribute
     def xcab_aft_divider(self):
-        return self.xcab_economy_seats + self.n_economy_rows * self.seat_pitch_economy
+        return self.cabin_stations.aft_divider
 
     @Attribute
     def xcab_aft_toilet(self):
-        return self.xcab_aft_divider + self.divider_wall_thickness
+        return self.cabin_stations.aft_toilet
 
     @Attribute
     def xcab_aft_crossaisle(self):
-        return self.xcab_aft_toilet + self.l_toilet
+        return self.cabin_stations.aft_crossaisle
 
     @Attribute
     def xcab_aft_galley(self):
-        return self.xcab_aft_crossaisle + self.l_cross_aisle
+        return self.cabin_stations.aft_galley
 
     @Attribute
     def xcab_aft_bulkhead(self):
-        return self.xcab_aft_galley + self.l_galley
+        return self.cabin_stations.aft_bulkhead
+
+    @Attribute
+    def firstclass_row_x_positions(self):
+        """Local x positions of the first class seat rows with respect to the start of the
+        cabin"""
+        return (self.xcab_firstclass_seats + self.seat_pitch_firstclass - self.seat_depth +
+                np.arange(self.n_firstclass_rows) * self.seat_pitch_firstclass)
+
+    @Attribute
+    def starboard_firstclass_y(self):
+        """Local y position of the starboard first class seat rows"""
+        return 0.5 * self.cabin_width - self.n_seats_starboard_firstclass * \
+            self.seat_width_firstclass - self.armrest_width - self.seat_clearance
+
+    @Attribute
+    def starboard_economy_y(self):
+        """Local y position of the starboard economy seat rows"""
+        return 0.5 * self.cabin_width - self.n_seats_starboard_economy * \
+            self.seat_width_economy - self.armrest_width - self.seat_clearance
+
+    @Attribute
+    def economy_row_x_positions(self):
+        """Local x positions of the economy seat rows with respect to the start of the cabin"""
+        return (self.xcab_economy_seats + self.seat_pitch_economy - self.seat_depth +
+                np.arange(self.n_economy_rows) * self.seat_pitch_economy)
+
+    @Attribute
+    def firstclass_seats_cog_x(self):
+        """Global x positions of the c.g. of the first class seat rows, read by the weight and
+        balance analysis without visiting the quantified seat parts"""
+        return self.cabin.position.x + self.firstclass_row_x_positions + 0.5 * self.seat_depth
+
+    @Attribute
+    def economy_seats_cog_x(self):
+        """Global x positions of the c.g. of the economy seat rows, read by the weight and
+        balance analysis without visiting the quantified seat parts"""
+        return self.cabin.position.x + self.economy_row_x_positions + 0.5 * self.seat_depth
+
+    @Attribute
+    def port_firstclass_position(self):
+        """Position of the port first class seat rows at the start of the cabin"""
+        return translate(self.cabin.position, 'y', -0.5 * self.cabin_width)
+
+    @Attribute
+    def starboard_firstclass_position(self):
+        """Position of the starboard first class seat rows at the start of the cabin"""
+        return translate(self.cabin.position, 'y', self.starboard_firstclass_y)
+
+    @Attribute
+    def port_economy_position(self):
+        """Position of the port economy seat rows at the start of the cabin"""
+        return translate(self.cabin.position, 'y', -0.5 * self.cabin_width + self.seat_clearance)
+
+    @Attribute
+    def starboard_economy_position(self):
+        """Position of the starboard economy seat rows at the start of the cabin"""
+        return translate(self.cabin.position, 'y', self.starboard_economy_y)
 
     @xcab_aft_bulkhead.validator
     def xcab_aft_bulkhead(self, value):
-        if value + self.x_cabin < self.mainwing_wingbox_x_end:
+        x_aft_bulkhead = value + self.x_cabin
+        if x_aft_bulkhead < self.mainwing_wingbox_x_end:
             msg = f'The aircraft layout is such that the main wing intersects with the aft ' \
                   f'pressure bulkhead. Increase the length of the cabin, for example by ' \
                   f'increasing the number of rows in economy. Or move the location of ' \
                   f'the main wing forward'
             return False, msg
 
-        elif value + self.x_cabin > 0.85 * self.l_fuselage:
+        elif x_aft_bulkhead > 0.85 * self.l_fuselage:
             msg = f'The aft pressure bulkhead is located to far aft. Reduce the number of rows ' \
                   f'in the cabin'
             return False, msg
@@ -344,7 +497,8 @@ class Fuselage(GeomBase):
     @Part
     def fus_structure(self):
         return FuselageStructure(pass_down='d_outer, d_inner, l_fuselage, l_nosecone, '
-                                           'l_tailcone, cabinfloor_height, cargofloor_height',
+                                           'l_tailcone, cabinfloor_height, cargofloor_height, '
+                                           'structure_mesh_deflection',
                                  x_cabin_floor_end=self.x_cabin + self.xcab_aft_bulkhead)
 
     # create cockpit (simplified)
@@ -354,7 +508,7 @@ class Fuselage(GeomBase):
                    self.d_outer,
                    self.d_outer * 0.1,
                    position=translate(self.position,
-                                      'y', -0.5 * self.d_outer,
+                                      'y', -self.r_outer,
                                       'z', self.d_outer * 0.15))
 
     @Part
@@ -366,17 +520,15 @@ class Fuselage(GeomBase):
 
     @Part
     def cockpit_instruments(self):
-        return Subtracted(Common(shape_in=Box(self.l_cockpit_instruments,
-                                              self.d_inner,
-                                              self.cabinfloor_height - self.d_inner / 2
-                                              + 0.15 * self.d_outer,
-                                              position=translate(self.position,
-                                                                 'y', -0.5 * self.d_outer,
-                                                                 'z', self.d_inner / 2
-                                                                 - self.cabinfloor_height)),
-                                 tool=self.fus_structure.inner_nosecone_section),
-                          tool=self.cockpit_window_cutout,
-                          color='gray')
+        # the top of the instrument panel is the bottom of the window, so no window cutout
+        return Common(shape_in=Box(self.l_cockpit_instruments,
+                                   self.d_inner,
+                                   self.cabinfloor_height - self.r_inner + 0.15 * self.d_outer,
+                                   position=translate(self.position,
+                                                      'y', -self.r_outer,
+                                                      'z', self.r_inner - self.cabinfloor_height)),
+                      tool=self.fus_structure.inner_nosecone_section,
+                      color='gray')
 
     @Part
     def cockpit_seats(self):
@@ -387,7 +539,7 @@ class Fuselage(GeomBase):
                                        'x', self.l_cockpit_instruments + 0.2,
                                        'y', -0.2 - self.seat_width_firstclass + child.index * (
                                                0.4 + self.seat_width_firstclass),
-                                       'z', self.d_inner / 2 - self.cabinfloor_height))
+                                       'z', self.r_inner - self.cabinfloor_height))
 
     # ----- CREATE CABIN ----- #
     # Most of the parts are commons using the inner fuselage and simple boxes. The boxes are not
@@ -397,7 +549,7 @@ class Fuselage(GeomBase):
     def cabin(self):
         return Box(1, 1, 1, position=translate(self.position,
                                                'x', self.x_cabin,
-                                               'z', self.d_inner / 2 - self.cabinfloor_height))
+                                               'z', self.r_inner - self.cabinfloor_height))
 
     @Part(in_tree=False)
     def aisle_for_cutting(self):
@@ -414,9 +566,8 @@ class Fuselage(GeomBase):
                                    self.cabinfloor_height,
                                    position=translate(self.cabin.position,
                                                       'x', -self.divider_wall_thickness,
-                                                      'y', -self.d_inner / 2)),
-                      tool=[self.fus_structure.inner_nosecone_section,
-                            self.fus_structure.inner_cylindrical_section],
+                                                      'y', -self.r_inner)),
+                      tool=self.fus_structure.inner_sections,
                       color='Gray')
 
     @Part
@@ -427,8 +578,7 @@ class Fuselage(GeomBase):
                                    position=translate(self.cabin.position,
                                                       'y', self.full_cabin_width / 2 -
                                                       self.w_galley)),
-                      tool=[self.fus_structure.inner_nosecone_section,
-                            self.fus_structure.inner_cylindrical_section],
+                      tool=self.fus_structure.inner_sections,
                       color='lightgreen')
 
     @Part
@@ -438,21 +588,9 @@ class Fuselage(GeomBase):
                                    self.cabinfloor_height,
                                    position=translate(self.cabin.position,
                                                       'y', -self.full_cabin_width / 2)),
-                      tool=[self.fus_structure.inner_nosecone_section,
-                            self.fus_structure.inner_cylindrical_section],
+                      tool=self.fus_structure.inner_sections,
                       color='lightblue')
 
-    @Part
-    def fwd_doors(self):
-        return Common(shape_in=Box(self.door_width_type1,
-                                   self.d_outer,
-                                   self.door_height_type1,
-                                   position=translate(self.cabin.position,
-                                                      'x', self.xcab_fwd_crossaisle + 0.03,
-                                                      'y', -self.d_outer / 2)),
-                      tool=[self.fus_structure.nosecone_section,
-                            self.fus_structure.cylindrical_section])
-
     @Part
     def fwd_divider(self):
         return Subtracted(shape_in=Common(shape_in=Box(self.divider_wall_thickness,
@@ -461,9 +599,8 @@ class Fuselage(GeomBase):
                                                        position=translate(self.cabin.position,
                                                                           'x',
                                                                           self.xcab_fwd_divider,
-                                                                          'y', -self.d_inner / 2)),
-                                          tool=[self.fus_structure.inner_cylindrical_section,
-                                                self.fus_structure.inner_nosecone_section]),
+                                                                          'y', -self.r_inner)),
+                                          tool=self.fus_structure.inner_sections),
                           tool=self.aisle_for_cutting)
 
     @Part
@@ -474,11 +611,8 @@ class Fuselage(GeomBase):
                     n_seats=self.n_seats_port_firstclass,
                     color='Red',
                     quantify=self.n_firstclass_rows,
-                    position=translate(self.cabin.position,
-                                       'y', -0.5 * self.cabin_width,
-                                       'x',
-                                       self.xcab_firstclass_seats + self.seat_pitch_firstclass -
-                                       self.seat_depth + child.index * self.seat_pitch_firstclass))
+                    position=translate(self.port_firstclass_position,
+                                       'x', float(self.firstclass_row_x_positions[child.index])))
 
     @Part
     def starboard_firstclass_rows(self):
@@ -488,14 +622,8 @@ class Fuselage(GeomBase):
                     n_seats=self.n_seats_starboard_firstclass,
                     color='Red',
                     quantify=self.n_firstclass_rows,
-                    position=translate(self.cabin.position,
-                                       'y',
-                                       0.5 * self.cabin_width - self.n_seats_starboard_firstclass *
-                                       self.seat_width_firstclass - self.armrest_width -
-                                       self.seat_clearance,
-                                       'x',
-                                       self.xcab_firstclass_seats + self.seat_pitch_firstclass -
-                                       self.seat_depth + child.index * self.seat_pitch_firstclass))
+                    position=translate(self.starboard_firstclass_position,
+                                       'x', float(self.firstclass_row_x_positions[child.index])))
 
     @Part
     def class_divider(self):
@@ -505,9 +633,8 @@ class Fuselage(GeomBase):
                                                        position=translate(self.cabin.position,
                                                                           'x',
                                                                           self.xcab_class_divider,
-                                                                          'y', -self.d_inner / 2)),
-                                          tool=[self.fus_structure.inner_cylindrical_section,
-                                                self.fus_structure.inner_nosecone_section]),
+                                                                          'y', -self.r_inner)),
+                                          tool=self.fus_structure.inner_sections),
                           tool=self.aisle_for_cutting,
                           suppress=not (self.n_firstclass_rows > 0 and self.n_economy_rows > 0))
 
@@ -519,11 +646,8 @@ class Fuselage(GeomBase):
                     n_seats=self.n_seats_port_economy,
                     color='Red',
                     quantify=self.n_economy_rows,
-                    position=translate(self.cabin.position,
-                                       'y', -0.5 * self.cabin_width + self.seat_clearance,
-                                       'x',
-                                       self.xcab_economy_seats + self.seat_pitch_economy -
-                                       self.seat_depth + child.index * self.seat_pitch_economy))
+                    position=translate(self.port_economy_position,
+                                       'x', float(self.economy_row_x_positions[child.index])))
 
     @Part
     def starboard_economy_rows(self):
@@ -533,14 +657,8 @@ class Fuselage(GeomBase):
                     n_seats=self.n_seats_starboard_economy,
                     color='Red',
                     quantify=self.n_economy_rows,
-                    position=translate(self.cabin.position,
-                                       'y',
-                                       0.5 * self.cabin_width - self.n_seats_starboard_economy *
-                                       self.seat_width_economy - self.armrest_width -
-                                       self.seat_clearance,
-                                       'x',
-                                       self.xcab_economy_seats + self.seat_pitch_economy -
-                                       self.seat_depth + child.index * self.seat_pitch_economy))
+                    position=translate(self.starboard_economy_position,
+                                       'x', float(self.economy_row_x_positions[child.index])))
 
     @Part
     def aft_divider(self):
@@ -550,46 +668,28 @@ class Fuselage(GeomBase):
                                                        position=translate(self.cabin.position,
                                                                           'x',
                                                                           self.xcab_aft_divider,
-                                                                          'y', -self.d_inner / 2)),
-                                          tool=[self.fus_structure.inner_cylindrical_section,
-                                                self.fus_structure.inner_tailcone_section]),
+                                                                          'y', -self.r_inner)),
+                                          tool=self.fus_structure.inner_sections),
                           tool=self.aisle_for_cutting)
 
     @Part
-    def aft_port_toilet(self):
-        return Common(shape_in=Box(self.l_toilet,
-                                   self.w_toilet,
-                                   self.cabinfloor_height,
-                                   position=translate(self.cabin.position,
-                                                      'y', -self.full_cabin_width / 2,
-                                                      'x', self.xcab_aft_toilet)),
-                      tool=[self.fus_structure.inner_tailcone_section,
-                            self.fus_structure.inner_cylindrical_section],
-                      color='lightblue')
-
-    @Part
-    def aft_starboard_toilet(self):
-        return Common(shape_in=Box(self.l_toilet,
-                                   self.w_toilet,
-                                   self.cabinfloor_height,
-                                   position=translate(self.cabin.position,
-                                                      'y',
-                                                      self.full_cabin_width / 2 - self.w_toilet,
-                                                      'x', self.xcab_aft_toilet)),
-                      tool=[self.fus_structure.inner_tailcone_section,
-                            self.fus_structure.inner_cylindrical_section],
-                      color='lightblue')
-
-    @Part
-    def aft_doors(self):
-        return Common(shape_in=Box(self.door_width_type1,
-                                   self.d_outer,
-                                   self.door_height_type1,
-                                   position=translate(self.cabin.position,
-                                                      'x', self.xcab_aft_crossaisle + 0.03,
-                                                      'y', -self.d_outer / 2)),
-                      tool=[self.fus_structure.tailcone_section,
-                            self.fus_structure.cylindrical_section])
+    def aft_toilets(self):
+        """Port and starboard aft toilets, intersected with the fuselage in a single boolean"""
+        return Common(shape_in=Compound(built_from=[
+            Box(self.l_toilet,
+                self.w_toilet,
+                self.cabinfloor_height,
+                position=translate(self.cabin.position,
+                                   'y', -self.full_cabin_width / 2,
+                                   'x', self.xcab_aft_toilet)),
+            Box(self.l_toilet,
+                self.w_toilet,
+                self.cabinfloor_height,
+                position=translate(self.cabin.position,
+                                   'y', self.full_cabin_width / 2 - self.w_toilet,
+                                   'x', self.xcab_aft_toilet))]),
+            tool=self.fus_structure.inner_sections,
+            color='lightblue')
 
     @Part
     def aft_galley(self):
@@ -599,13 +699,29 @@ class Fuselage(GeomBase):
                                    position=translate(self.cabin.position,
                                                       'y', -0.5 * self.full_cabin_width,
                                                       'x', self.xcab_aft_galley)),
-                      tool=[self.fus_structure.inner_tailcone_section,
-                            self.fus_structure.inner_cylindrical_section],
+                      tool=self.fus_structure.inner_sections,
                       color='lightgreen')
 
-    # ----- WINDOWS ----- #
-    # The windowsare created using a common of the compound of multiple boxes that intersect the
-    # fuselage.
+    # ----- DOORS AND WINDOWS ----- #
+    # The doors and windows are created using a common of the compound of multiple boxes that
+    # intersect the fuselage.
+
+    @Part
+    def doors(self):
+        return Common(shape_in=Compound(built_from=[
+            Box(self.door_width_type1,
+                self.d_outer,
+                self.door_height_type1,
+                position=translate(self.cabin.position,
+                                   'x', self.xcab_fwd_crossaisle + 0.03,
+                                   'y', -self.r_outer)),
+            Box(self.door_width_type1,
+                self.d_outer,
+                self.door_height_type1,
+                position=translate(self.cabin.position,
+                                   'x', self.xcab_aft_crossaisle + 0.03,
+                                   'y', -self.r_outer))]),
+            tool=self.fus_structure.shell_sections)
 
     @Part(in_tree=False)
     def cabin_window_cutboxes(self):
@@ -614,92 +730,65 @@ class Fuselage(GeomBase):
                    self.cabin_window_height,
                    quantify=self.n_cabin_windows,
                    position=translate(self.cabin.position,
-                                      'x',
-                                      self.xcab_cabin_windows + 0.5 * (self.cabin_window_spacing
-                                                                       - self.cabin_window_width) +
-                                      child.index * self.cabin_window_spacing,
-                                      'y', -self.d_outer / 2,
+                                      'x', float(self.cabin_window_x_positions[child.index]),
+                                      'y', -self.r_outer,
                                       'z', self.cabin_window_overfloor))
 
     @Part
     def cabin_windows(self):
         return Common(shape_in=Compound(built_from=self.cabin_window_cutboxes),
-                      tool=[self.fus_structure.nosecone_section,
-                            self.fus_structure.tailcone_section,
-                            self.fus_structure.cylindrical_section],
+                      tool=self.fus_structure.shell_sections,
                       transparency=0.5,
-                      color='lightblue')
+                      color='lightblue',
+                      suppress=self.n_cabin_windows == 0)
 
     # ----- OVERHEAD STORAGE ----- #
 
-    @Part
-    def overhead_storage_firstclass(self):
-        return Subtracted(Common(shape_in=Box(self.xcab_class_divider -
-                                              self.xcab_firstclass_seats,
-                                              self.d_inner,
-                                              self.cabinfloor_height -
-                                              self.headroom_height,
-                                              position=translate(self.cabin.position,
-                                                                 'x', self.xcab_firstclass_seats,
-                                                                 'y', -0.5 * self.d_inner,
-                                                                 'z', self.headroom_height)),
-                                 tool=[self.fus_structure.inner_nosecone_section,
-                                       self.fus_structure.inner_cylindrical_section]),
-                          tool=self.aisle_for_cutting,
-                          color='white', transparency=0.3,
-                          suppress=self.n_firstclass_rows == 0)
+    @Attribute
+    def overhead_storage_extents(self):
+        """Local x position and length of the overhead storage above each seated class"""
+        return [(x_start, x_end - x_start) for x_start, x_end, n_rows in
+                ((self.xcab_firstclass_seats, self.xcab_class_divider, self.n_firstclass_rows),
+                 (self.xcab_economy_seats, self.xcab_aft_divider, self.n_economy_rows))
+                if n_rows > 0]
 
     @Part
-    def overhead_storage_economy(self):
-        return Subtracted(Common(shape_in=Box(self.xcab_aft_divider -
-                                              self.xcab_economy_seats,
-                                              self.d_inner,
-                                              self.cabinfloor_height -
-                                              self.headroom_height,
-                                              position=translate(self.cabin.position,
-                                                                 'x', self.xcab_economy_seats,
-                                                                 'y', -0.5 * self.d_inner,
-                                                                 'z', self.headroom_height)),
-                                 tool=[self.fus_structure.inner_tailcone_section,
-                                       self.fus_structure.inner_cylindrical_section]),
-                          tool=self.aisle_for_cutting,
-                          color='white', transparency=0.3,
-                          suppress=self.n_economy_rows == 0)
+    def overhead_storage(self):
+        """First class and economy overhead storage, intersected with the fuselage and cut by
+        the aisle in a single boolean each"""
+        return Subtracted(Common(shape_in=Compound(built_from=[
+            Box(length,
+                self.d_inner,
+                self.cabinfloor_height - self.headroom_height,
+                position=translate(self.cabin.position,
+                                   'x', x_start,
+                                   'y', -self.r_inner,
+                                   'z', self.headroom_height))
+            for x_start, length in self.overhead_storage_extents]),
+            tool=self.fus_structure.inner_sections),
+            tool=self.aisle_for_cutting,
+            color='white', transparency=0.3,
+            suppress=not self.overhead_storage_extents)
 
     # ----- HYDROGEN TANKS ----- #
-    # The hydrogen tanks are placed between two dummy limits that are used to calculate the
-    # diameter of the fuselage at that location and, therefore, the maximum size of the tanks.
+    # The hydrogen tanks are sized by the inner diameter of the fuselage at their aft limit and,
+    # with two tanks, halfway along the available length.
 
-    @Part(in_tree=False)
-    def dummy_aft_limit_tank(self):
-        return Common(shape_in=Box(0.01, self.d_inner, self.d_inner,
-                                   position=translate(self.position,
-                                                      'x', self.aft_limit_hydrogen_tank *
-                                                      self.l_fuselage,
-                                                      'y', -0.5 * self.d_inner,
-                                                      'z', -0.5 * self.d_inner)),
-                      tool=[self.fus_structure.inner_tailcone_section,
-                            self.fus_structure.inner_cylindrical_section])
+    @Attribute
+    def x_aft_limit_tank(self):
+        return self.aft_limit_hydrogen_tank * self.l_fuselage
 
-    @Part(in_tree=False)
-    def dummy_mid_limit_tank(self):
-        return Common(shape_in=Box(0.01, self.d_inner, self.d_inner,
-                                   position=translate(self.position,
-                                                      'x', self.x_tank_begin +
-                                                      self.available_tank_length / 2,
-                                                      'y', -0.5 * self.d_inner,
-                                                      'z', -0.5 * self.d_inner)),
-                      tool=[self.fus_structure.inner_tailcone_section,
-                            self.fus_structure.inner_cylindrical_section],
-                      suppress=self.n_hydrogen_tanks == 1)
+    @Attribute
+    def x_mid_limit_tank(self):
+        return self.x_tank_begin + self.available_tank_length / 2
 
     @Attribute
     def aft_limit_tank_diameter(self):
-        return self.dummy_aft_limit_tank.oriented_bbox.height
+        return self.fus_structure.inner_diameter_at(self.x_aft_limit_tank)
 
     @Attribute
     def mid_limit_tank_diameter(self):
-        return self.dummy_mid_limit_tank.oriented_bbox.height
+        return self.fus_structure.inner_diameter_at(self.x_mid_limit_tank)
 
     @Attribute
     def x_tank_begin(self):
@@ -724,7 +813,7 @@ class Fuselage(GeomBase):
 
     @Attribute
     def available_tank_length(self):
-        return self.aft_limit_hydrogen_tank * self.l_fuselage - self.x_tank_begin
+        return self.x_aft_limit_tank - self.x_tank_begin
 
     @Part
     def fwd_hydrogen_tank(self):
@@ -733,8 +822,8 @@ class Fuselage(GeomBase):
                                                     self.mid_limit_tank_diameter - 0.1,
                             position=translate(self.position,
                                                'x', self.x_tank_begin + 0.05,
-                                               'z',
-                                               self.dummy_mid_limit_tank.oriented_bbox.center.z),
+                                               'z', self.fus_structure.inner_centre_z_at(
+                                                   self.x_mid_limit_tank)),
                             suppress=self.n_hydrogen_tanks == 1)
 
     @Part
@@ -749,31 +838,29 @@ class Fuselage(GeomBase):
                                                self.available_tank_length / 2 if
                                                self.n_hydrogen_tanks == 2 else
                                                self.x_tank_begin + 0.05,
-                                               'z',
-                                               self.dummy_aft_limit_tank.oriented_bbox.center.z))
+                                               'z', self.fus_structure.inner_centre_z_at(
+                                                   self.x_aft_limit_tank)))
 
     @Attribute
     def total_tank_volume(self):
-        if self.n_hydrogen_tanks == 1:
-            return self.aft_hydrogen_tank.tank_volume
-        else:
-            return self.fwd_hydrogen_tank.tank_volume + self.aft_hydrogen_tank.tank_volume
+        volume = self.aft_hydrogen_tank.tank_volume
+        if self.n_hydrogen_tanks == 2:
+            volume += self.fwd_hydrogen_tank.tank_volume
+        return volume
 
     # ----- CARGO ----- #
     @Part
     def cargo_containers_fore(self):
         return CargoContainer(quantify=self.n_cargo_containers_fore,
                               position=translate(self.fwd_cargo_start,
-                                                 'x', child.index * (self.cargo_container_depth +
-                                                                     self.cargo_spacing),
+                                                 'x', float(self.cargo_x_fore[child.index]),
                                                  'y', - 0.5 * self.cargo_container_width))
 
     @Part
     def cargo_containers_aft(self):
         return CargoContainer(quantify=self.n_cargo_containers_aft,
                               position=translate(self.aft_cargo_start,
-                                                 'x', child.index * (self.cargo_container_depth +
-                                                                     self.cargo_spacing),
+                                                 'x', float(self.cargo_x_aft[child.index]),
                                                  'y', - 0.5 * self.cargo_container_width))
 
     # ----- MISCELLANEOUS ----- #
@@ -785,8 +872,8 @@ class Fuselage(GeomBase):
                                    self.d_inner,
                                    position=translate(self.position,
                                                       'x', 0.95 * self.l_fuselage,
-                                                      'y', -0.5 * self.d_inner,
-                                                      'z', -0.5 * self.d_inner)),
+                                                      'y', -self.r_inner,
+                                                      'z', -self.r_inner)),
                       tool=self.fus_structure.inner_tailcone_section,
                       color='gray')
 
@@ -800,11 +887,9 @@ class Fuselage(GeomBase):
                          self.skin_thickness,
                          position=translate(self.position,
                                             "x", self.mainwing_wingbox_x_start,
-                                            "y", -self.d_outer / 2,
-                                            "z", -self.d_outer / 2)),
-            tool=[self.fus_structure.inner_nosecone_section,
-                  self.fus_structure.inner_cylindrical_section,
-                  self.fus_structure.inner_tailcone_section],
+                                            "y", -self.r_outer,
+                                            "z", -self.r_outer)),
+            tool=self.fus_structure.inner_sections,
             color='gray')
 
     @Part
@@ -816,11 +901,9 @@ class Fuselage(GeomBase):
                                    self.skin_thickness,
                                    position=translate(self.position,
                                                       "x", 0.5,
-                                                      "y", -self.d_outer / 2,
-                                                      "z", -self.d_outer / 2)),
-                      tool=[self.fus_structure.inner_nosecone_section,
-                            self.fus_structure.inner_cylindrical_section,
-                            self.fus_structure.inner_tailcone_section],
+                                                      "y", -self.r_outer,
+                                                      "z", -self.r_outer)),
+                      tool=self.fus_structure.inner_sections,
                       color='gray')
 
 
@@ -1,6 +1,7 @@
 from parapy.geom import *
 from parapy.core import *
 from parapy.core.validate import *
+import numpy as np
 
 
 class FuselageStructure(GeomBase):
@@ -39,6 +40,14 @@ class FuselageStructure(GeomBase):
     def l_cylindrical(self):
         return self.l_fuselage - self.l_nosecone - self.l_tailcone
 
+    @Attribute
+    def r_outer(self):
+        return self.d_outer / 2
+
+    @Attribute
+    def r_inner(self):
+        return self.d_inner / 2
+
     x_cabin_floor_end = Input(14., private=not (__name__ == '__main__'), validator=Positive())
 
     # nosecone / tailcone for A320. Can be changed once other aircraft are considered
@@ -51,15 +60,18 @@ class FuselageStructure(GeomBase):
     # ensure all are within limits
     @nosecone_diameters.validator
     def nosecone_diameters(self, value):
-        return all([0 < v <= 100 for v in value])
+        value = np.asarray(value)
+        return bool(((value > 0) & (value <= 100)).all())
 
     @tailcone_diameters.validator
     def tailcone_diameters(self, value):
-        return all([0 < v <= 100 for v in value])
+        value = np.asarray(value)
+        return bool(((value > 0) & (value <= 100)).all())
 
     @tailcone_diameters_pos.validator
     def tailcone_diameters_pos(self, value):
-        return all([0 <= v <= 100 for v in value])
+        value = np.asarray(value)
+        return bool(((value >= 0) & (value <= 100)).all())
 
     # inner geometry variables
     cabinfloor_height = Input(2.2, private=not (__name__ == '__main__'))  # [m]
@@ -76,6 +88,31 @@ class FuselageStructure(GeomBase):
         return self.d_inner > value > self.cabinfloor_height
 
     structure_transparency = Input(0.8, validator=Range(0, 1))
+    # tessellation tolerance of the skin sections, can be coarsened for design exploration
+    structure_mesh_deflection = Input(1e-3, validator=Positive())  # [m]
+
+    # profile stations, shared by the inner and outer profiles
+    @Attribute
+    def nosecone_x_positions(self):
+        """Local x positions of the nosecone profiles [m]"""
+        n_nose = len(self.nosecone_diameters)
+        return np.arange(n_nose) * (self.l_nosecone / (n_nose - 1))
+
+    @Attribute
+    def nosecone_z_positions(self):
+        """Local z positions of the centres of the nosecone profiles [m]"""
+        return np.asarray(self.nosecone_z_translate) * (self.d_outer / 100.)
+
+    @Attribute
+    def tailcone_x_positions(self):
+        """Local x positions of the tailcone profiles [m]"""
+        return self.l_nosecone + self.l_cylindrical + \
+            np.asarray(self.tailcone_diameters_pos) * (0.01 * self.l_tailcone)
+
+    @Attribute
+    def tailcone_z_positions(self):
+        """Local z positions of the centres of the tailcone profiles [m]"""
+        return np.asarray(self.tailcone_z_translate) * (self.d_outer / 100.)
 
     # ----- NOSE SECTION ----- #
     # The nosecone section is shown geometrically by subtracting an inner solid from an outer
@@ -85,31 +122,23 @@ class FuselageStructure(GeomBase):
     def outer_nosecone_profiles(self):
         return Circle(quantify=len(self.nosecone_diameters),
                       color='Black',
-                      radius=[i * self.d_outer / 100.
-                              for i in self.nosecone_diameters][child.index] / 2,
+                      radius=self.nosecone_diameters[child.index] * self.d_outer / 200.,
                       position=translate(self.position.rotate90('y'),
                                          Vector(1, 0, 0),
-                                         child.index * (self.l_nosecone / (
-                                                 len(self.nosecone_diameters) - 1)),
+                                         float(self.nosecone_x_positions[child.index]),
                                          Vector(0, 0, 1),
-                                         self.nosecone_z_translate[child.index] / 100. *
-                                         self.d_outer)
-                      )
+                                         float(self.nosecone_z_positions[child.index])))
 
     @Part
     def inner_nosecone_profiles(self):
         return Circle(quantify=len(self.nosecone_diameters),
                       color='Black',
-                      radius=[i * self.d_inner / 100.
-                              for i in self.nosecone_diameters][child.index] / 2,
+                      radius=self.nosecone_diameters[child.index] * self.d_inner / 200.,
                       position=translate(self.position.rotate90('y'),
                                          Vector(1, 0, 0),
-                                         child.index * (self.l_nosecone / (
-                                                 len(self.nosecone_diameters) - 1)),
+                                         float(self.nosecone_x_positions[child.index]),
                                          Vector(0, 0, 1),
-                                         self.nosecone_z_translate[child.index] / 100. *
-                                         self.d_outer)
-                      )
+                                         float(self.nosecone_z_positions[child.index])))
 
     @Part(in_tree=False)
     def outer_nosecone_section(self):
@@ -125,34 +154,23 @@ class FuselageStructure(GeomBase):
                                tool=self.inner_nosecone_section,
                                color='Gray',
                                transparency=self.structure_transparency,
-                               mesh_deflection=1e-3)
+                               mesh_deflection=self.structure_mesh_deflection)
 
     # ----- CYLINDRICAL SECTION ----- #
     # The cylindrical section is shown geometrically by subtracting an inner solid from an outer
     # one to obtain a shell.
 
-    @Part
-    def outer_cylindrical_profiles(self):
-        return Circle(radius=self.d_outer / 2, quantify=2, color='Black',
-                      position=translate(self.position.rotate90('y'),
-                                         Vector(1, 0, 0),
-                                         self.l_nosecone + child.index * self.l_cylindrical))
-
-    @Part
-    def inner_cylindrical_profiles(self):
-        return Circle(radius=self.d_inner / 2,
-                      quantify=2, color='Black',
-                      position=translate(self.position.rotate90('y'),
-                                         Vector(1, 0, 0),
-                                         self.l_nosecone + child.index * self.l_cylindrical))
-
     @Part(in_tree=False)
     def outer_cylindrical_section(self):
-        return LoftedSolid(profiles=self.outer_cylindrical_profiles)
+        return Cylinder(radius=self.r_outer, height=self.l_cylindrical,
+                        position=translate(self.position.rotate90('y'),
+                                           Vector(1, 0, 0), self.l_nosecone))
 
     @Part(in_tree=False)
     def inner_cylindrical_section(self):
-        return LoftedSolid(profiles=self.inner_cylindrical_profiles)
+        return Cylinder(radius=self.r_inner, height=self.l_cylindrical,
+                        position=translate(self.position.rotate90('y'),
+                                           Vector(1, 0, 0), self.l_nosecone))
 
     @Part
     def cylindrical_section(self):
@@ -160,7 +178,7 @@ class FuselageStructure(GeomBase):
                                tool=self.inner_cylindrical_section,
                                color='Gray',
                                transparency=self.structure_transparency,
-                               mesh_deflection=1e-3)
+                               mesh_deflection=self.structure_mesh_deflection)
 
     # ----- TAIL SECTION ----- #
     # The tailcone section is shown geometrically by subtracting an inner solid from an outer
@@ -170,33 +188,23 @@ class FuselageStructure(GeomBase):
     def outer_tailcone_profiles(self):
         return Circle(quantify=len(self.tailcone_diameters),
                       color='Black',
-                      radius=[i * self.d_outer / 100. for i in
-                              self.tailcone_diameters][child.index] / 2,
+                      radius=self.tailcone_diameters[child.index] * self.d_outer / 200.,
                       position=translate(self.position.rotate90('y'),
                                          Vector(1, 0, 0),
-                                         self.l_nosecone + self.l_cylindrical + 0.01 *
-                                         self.tailcone_diameters_pos[ child.index] *
-                                         self.l_tailcone,
+                                         float(self.tailcone_x_positions[child.index]),
                                          Vector(0, 0, 1),
-                                         self.tailcone_z_translate[child.index] / 100. *
-                                         self.d_outer)
-                      )
+                                         float(self.tailcone_z_positions[child.index])))
 
     @Part
     def inner_tailcone_profiles(self):
         return Circle(quantify=len(self.tailcone_diameters),
                       color='Black',
-                      radius=[i * self.d_inner / 100. for i in
-                              self.tailcone_diameters][child.index] / 2,
+                      radius=self.tailcone_diameters[child.index] * self.d_inner / 200.,
                       position=translate(self.position.rotate90('y'),
                                          Vector(1, 0, 0),
-                                         self.l_nosecone + self.l_cylindrical + 0.01 *
-                                         self.tailcone_diameters_pos[child.index] *
-                                         self.l_tailcone,
+                                         float(self.tailcone_x_positions[child.index]),
                                          Vector(0, 0, 1),
-                                         self.tailcone_z_translate[child.index] / 100. *
-                                         self.d_outer)
-                      )
+                                         float(self.tailcone_z_positions[child.index])))
 
     @Part(in_tree=False)
     def outer_tailcone_section(self):
@@ -206,13 +214,54 @@ class FuselageStructure(GeomBase):
     def inner_tailcone_section(self):
         return LoftedSolid(profiles=self.inner_tailcone_profiles)
 
+    @Part(in_tree=False)
+    def inner_sections(self):
+        """Fused inner nosecone, cylindrical and tailcone sections, used as a single tool for
+        all parts that are cut to the inside of the fuselage"""
+        # the cylinder borders both cones, so it is fused into first
+        return FusedSolid(shape_in=self.inner_cylindrical_section,
+                          tool=[self.inner_nosecone_section,
+                                self.inner_tailcone_section])
+
     @Part
     def tailcone_section(self):
         return SubtractedSolid(shape_in=self.outer_tailcone_section,
                                tool=self.inner_tailcone_section,
                                color='Gray',
                                transparency=self.structure_transparency,
-                               mesh_deflection=1e-3)
+                               mesh_deflection=self.structure_mesh_deflection)
+
+    @Part(in_tree=False)
+    def shell_sections(self):
+        """Compound of the nosecone, cylindrical and tailcone skin sections, used as a single
+        tool for all parts that are cut to the fuselage skin"""
+        return Compound(built_from=[self.nosecone_section,
+                                    self.cylindrical_section,
+                                    self.tailcone_section])
+
+    # ----- INNER CROSS-SECTIONS ----- #
+    # The inner diameter and centre height at a given station are interpolated linearly between
+    # the profiles of the lofts, which avoids intersecting the lofted solids to measure them.
+
+    @Attribute
+    def inner_profile_stations(self):
+        """Local x positions, inner diameters and centre z positions of all inner profiles,
+        from the nose to the tail [m]"""
+        x = np.concatenate((self.nosecone_x_positions, self.tailcone_x_positions))
+        d = np.concatenate((self.nosecone_diameters, self.tailcone_diameters)) * \
+            (self.d_inner / 100.)
+        z = np.concatenate((self.nosecone_z_positions, self.tailcone_z_positions))
+        return x, d, z
+
+    def inner_diameter_at(self, x):
+        """Inner diameter of the fuselage at local x position x [m]"""
+        stations, diameters, _ = self.inner_profile_stations
+        return float(np.interp(x, stations, diameters))
+
+    def inner_centre_z_at(self, x):
+        """Local z position of the centre of the inner fuselage at local x position x [m]"""
+        stations, _, z = self.inner_profile_stations
+        return float(np.interp(x, stations, z))
 
     # ----- FLOORS ----- #
     # The cabin and cargo floors are obtained by finding the common of a rectangle with
@@ -224,33 +273,29 @@ class FuselageStructure(GeomBase):
         return Box(self.x_cabin_floor_end, self.d_outer,
                    self.cabinfloor_thickness,
                    position=translate(self.position,
-                                      'Y', -self.d_outer / 2,
-                                      'Z', self.d_inner / 2 -
+                                      'Y', -self.r_outer,
+                                      'Z', self.r_inner -
                                       self.cabinfloor_height -
                                       self.cabinfloor_thickness))
 
     @Part
     def cabin_floor(self):
         return Common(shape_in=self.cabin_floor_uncut,
-                      tool=[self.inner_cylindrical_section,
-                            self.inner_nosecone_section,
-                            self.inner_tailcone_section],
+                      tool=self.inner_sections,
                       color='Gray')
 
     @Part(in_tree=False)
     def cargo_floor_uncut(self):
         return Box(self.x_cabin_floor_end, self.d_outer, self.cargofloor_thickness,
                    position=translate(self.position,
-                                      'Y', -self.d_outer / 2,
-                                      'Z', self.d_inner / 2 - self.cargofloor_height -
+                                      'Y', -self.r_outer,
+                                      'Z', self.r_inner - self.cargofloor_height -
                                       self.cargofloor_thickness))
 
     @Part
     def cargo_floor(self):
         return Common(shape_in=self.cargo_floor_uncut,
-                      tool=[self.inner_cylindrical_section,
-                            self.inner_nosecone_section,
-                            self.inner_tailcone_section],
+                      tool=self.inner_sections,
                       color='Gray')
 
     # ----- REAR PRESSURE BULKHEAD ----- #
@@ -265,10 +310,9 @@ class FuselageStructure(GeomBase):
                                    self.d_inner,
                                    position=translate(self.position,
                                                       'x', self.x_cabin_floor_end,
-                                                      'y', -0.5 * self.d_inner,
-                                                      'z', -0.5 * self.d_inner)),
-                      tool=[self.inner_tailcone_section,
-                            self.inner_cylindrical_section],
+                                                      'y', -self.r_inner,
+                                                      'z', -self.r_inner)),
+                      tool=self.inner_sections,
                       color='Gray')
 
 
@@ -2,6 +2,9 @@ from parapy.core import *
 from parapy.geom import *
 from parapy.core.validate import *
 from math import pi
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 class HydrogenTank(GeomBase):
@@ -25,19 +28,20 @@ class HydrogenTank(GeomBase):
     @tank_cylindrical_length.validator
     def tank_cylindrical_length(self, value):
         if value < 0:
-            from tkinter import Tk, messagebox
-            Tk().withdraw()
-            messagebox.showwarning('Warning: Invalid Tank',
-                                   'The hydrogen tanks are no longer valid. Please reverse the '
-                                   'last change, reduce the number of tanks or increase the '
-                                   'available tank space by reducing the number of passengers.')
+            logger.warning('The hydrogen tanks are no longer valid (cylindrical length %.2f m). '
+                           'Please reverse the last change, reduce the number of tanks or '
+                           'increase the available tank space by reducing the number of '
+                           'passengers.', value)
             self.color = 'red'
         else:
-            self.color= 'yellow'
+            self.color = 'yellow'
         return value > 0
 
     # Parts
-    @Part
+    # The tank is a single solid, fused from a cylinder and two full spheres at its ends. The
+    # inner halves of the spheres are absorbed by the cylinder, leaving hemispherical caps.
+
+    @Part(in_tree=False)
     def tank_cylindrical_section(self):
         return Cylinder(radius=self.tank_outer_diameter / 2,
                         height=self.tank_cylindrical_length,
@@ -45,27 +49,29 @@ class HydrogenTank(GeomBase):
                                                   'x', self.tank_outer_diameter / 2),
                                         'y', 90, deg=True))
 
-    @Part
+    @Part(in_tree=False)
     def fwd_tank_cap(self):
         return Sphere(radius=self.tank_outer_diameter / 2,
-                      angle=pi,
-                      position=rotate(translate(self.position,
-                                                'x', self.tank_outer_diameter / 2),
-                                      'z', 90, deg=True))
+                      position=translate(self.position,
+                                         'x', self.tank_outer_diameter / 2))
 
-    @Part
+    @Part(in_tree=False)
     def aft_tank_cap(self):
         return Sphere(radius=self.tank_outer_diameter / 2,
-                      angle=pi,
-                      position=rotate(translate(self.position,
-                                                'x', self.tank_cylindrical_length +
-                                                self.tank_outer_diameter / 2),
-                                      'z', -90, deg=True))
+                      position=translate(self.position,
+                                         'x', self.tank_cylindrical_length +
+                                         self.tank_outer_diameter / 2))
+
+    @Part
+    def tank(self):
+        return FusedSolid(shape_in=self.tank_cylindrical_section,
+                          tool=[self.fwd_tank_cap, self.aft_tank_cap])
 
     @Attribute
     def tank_volume(self):
-        return self.tank_cylindrical_section.volume + self.fwd_tank_cap.volume + \
-               self.aft_tank_cap.volume
+        """Volume of the cylindrical section and the two hemispherical caps [m^3]"""
+        r = self.tank_outer_diameter / 2
+        return pi * r * r * (self.tank_cylindrical_length + 4 * r / 3)
 
 
 if __name__ == '__main__':
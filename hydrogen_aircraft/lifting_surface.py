@@ -2,7 +2,7 @@ from parapy.core import *
 from parapy.geom import *
 from parapy.core.validate import *
 import kbeutils.avl as avl
-import numpy as np
+import math
 from tkinter import Tk, messagebox
 from hydrogen_aircraft import Airfoil
 
@@ -33,15 +33,15 @@ class LiftingSurface(GeomBase):
     airfoil_kink = Input("NACA0012", validator=IsInstance(str))
     airfoil_tip = Input("NACA0012", validator=IsInstance(str))
 
-    chord_root = Input(6., validator=Positive and is_real_number)  # [m]
-    chord_kink = Input(3., validator=Positive and is_real_number)  # [m]
-    chord_tip = Input(3., validator=Positive and is_real_number)  # [m]
+    chord_root = Input(6., validator=And(Positive(), is_real_number))  # [m]
+    chord_kink = Input(3., validator=And(Positive(), is_real_number))  # [m]
+    chord_tip = Input(3., validator=And(Positive(), is_real_number))  # [m]
     tc_root = Input(1., validator=is_real_number)  # [%] thickness to chord ratio of airfoil
     tc_kink = Input(1., validator=is_real_number)  # [%] if 1 then ratio is taken ...
     tc_tip = Input(1., validator=is_real_number)  # [%] ... as the same as the airfoil .dat file
 
-    span = Input(34.09, validator=Positive and is_real_number)  # [m]
-    kink_loc = Input(10., validator=Positive(incl_zero=True) and is_real_number)  # [m] from
+    span = Input(34.09, validator=And(Positive(), is_real_number))  # [m]
+    kink_loc = Input(10., validator=And(Positive(incl_zero=True), is_real_number))  # [m] from
     # aircraft centerline
 
     @kink_loc.validator
@@ -65,13 +65,25 @@ class LiftingSurface(GeomBase):
     twist_kink = Input(0., validator=is_real_number)  # [deg]
     twist_tip = Input(0., validator=is_real_number)  # [deg]
 
+    # AVL vortex lattice density, can be reduced for faster interactive analyses
+    n_chordwise = Input(12, validator=And(IsInstance(int), Positive()))
+    n_spanwise = Input(20, validator=And(IsInstance(int), Positive()))
+
+    @Attribute
+    def tan_sweep(self):
+        return math.tan(math.radians(self.sweep))
+
+    @Attribute
+    def tan_dihedral(self):
+        return math.tan(math.radians(self.dihedral))
+
     @Attribute
     def profiles(self):
         """Lifting surface profile list"""
         if self.kink:
-            return [self.root_airfoil, self.kink_airfoil, self.tip_airfoil]
+            return self.root_airfoil, self.kink_airfoil, self.tip_airfoil
         else:
-            return [self.root_airfoil, self.tip_airfoil]
+            return self.root_airfoil, self.tip_airfoil
 
     @Part
     def root_airfoil(self):
@@ -79,7 +91,7 @@ class LiftingSurface(GeomBase):
         return Airfoil(airfoil_name=self.airfoil_root,
                        chord=self.chord_root,
                        tc=self.tc_root,
-                       position=rotate(self.position, "y", np.radians(self.incidence)),
+                       position=rotate(self.position, "y", math.radians(self.incidence)),
                        color='black')
 
     @Part
@@ -90,10 +102,10 @@ class LiftingSurface(GeomBase):
                        chord=self.chord_kink,
                        tc=self.tc_kink,
                        position=translate(
-                           rotate(self.position, "y", np.radians(self.twist_kink)),
+                           rotate(self.position, "y", math.radians(self.twist_kink)),
                            "y", self.kink_loc,
-                           "x", self.kink_loc * np.tan(np.radians(self.sweep)),
-                           "z", self.kink_loc * np.tan(np.radians(self.dihedral))),
+                           "x", self.kink_loc * self.tan_sweep,
+                           "z", self.kink_loc * self.tan_dihedral),
                        suppress=not self.kink,
                        color='black')
 
@@ -104,10 +116,10 @@ class LiftingSurface(GeomBase):
                        chord=self.chord_tip,
                        tc=self.tc_tip,
                        position=translate(
-                           rotate(self.position, "y", np.radians(self.twist_tip)),
+                           rotate(self.position, "y", math.radians(self.twist_tip)),
                            "y", self.span / 2,
-                           "x", (self.span / 2) * np.tan(np.radians(self.sweep)),
-                           "z", (self.span / 2) * np.tan(np.radians(self.dihedral))),
+                           "x", (self.span / 2) * self.tan_sweep,
+                           "z", (self.span / 2) * self.tan_dihedral),
                        color='black')
 
     @Part
@@ -131,21 +143,27 @@ class LiftingSurface(GeomBase):
                                     color='black')
 
     @Part
-    def lofted_solid(self):
-        """Wing lofted solid. Hidden in lifting surface is used to define an AVL surface"""
+    def lofted_shape(self):
+        """Wing lofted solid. If the lifting surface is used to define an AVL surface, only a
+        hidden lofted surface is built, as the end caps and solid closure are not needed."""
+        if self.avl_liftingsurface:
+            return LoftedSurface(profiles=self.profiles,
+                                 ruled=True,
+                                 mesh_deflection=0.0001,
+                                 color='gray',
+                                 hidden=True)
         return LoftedSolid(profiles=self.profiles,
                            ruled=True,
                            mesh_deflection=0.0001,
-                           color='gray',
-                           hidden=self.avl_liftingsurface)
+                           color='gray')
 
     @Part
     def avl_surface(self):
         """AVL surface definition"""
         return avl.Surface(name=self.name,
-                           n_chordwise=12,
+                           n_chordwise=self.n_chordwise,
                            chord_spacing=avl.Spacing.cosine,
-                           n_spanwise=20,
+                           n_spanwise=self.n_spanwise,
                            span_spacing=avl.Spacing.cosine,
                            y_duplicate=0.0 if self.mirrored else None,
                            sections=[self.root_avl_section, self.kink_avl_section,
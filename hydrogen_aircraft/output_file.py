@@ -15,12 +15,12 @@ def write_output_txt_file(aircraft, filename, output_list, aero_analysis,
         name of baseline aircraft
     filename : str
         name of file with date and time stamp
-    output_list : list
-        list of attribute names, attribute values and attribute units to be outputted to .txt file
+    output_list : tuple
+        (name, value, unit) tuples of the attributes to be outputted to .txt file
     aero_analysis : list
         list of results from aero engine analysis
-    avl_results : list
-        list of results from AVL analysis
+    avl_results : dict
+        total force coefficients and reference values of the AVL cruise case
     cl_cd : float
         lift to drag ratio calculated from AVL analysis [-]
     cg_mac : float
@@ -32,48 +32,42 @@ def write_output_txt_file(aircraft, filename, output_list, aero_analysis,
     r_maxpayload : float
         max payload range [m]
     """
-    with open(filename + '.txt', "w") as f:
-        str_header = 'Hydrogen Retrofit Design Report'
-        str_second = 'Baseline Aircraft: Airbus ' + aircraft
-        str_third = 'Instance: ' + filename[-17:]
-        f.writelines(
-            '==========================================================\n'
-            + str_header + '\n' + str_second + '\n' + str_third +
-            '\n----------------------------------------------------------\n' + 'Main Results ('
-                                                                               'int. analysis)\n')
+    def row(name, value, unit):
+        return f"{name:<26} {value!s:<22} {unit}"
 
-        for i in range(len(output_list)):
-            f.writelines(f"{str(output_list[i][0]).ljust(27)}"
-                         f"{str(output_list[i][1]).ljust(23)}"
-                         f"{output_list[i][2]}\n")
+    separator = '----------------------------------------------------------'
+    lines = ['==========================================================',
+             'Hydrogen Retrofit Design Report',
+             'Baseline Aircraft: Airbus ' + aircraft,
+             'Instance: ' + filename[-17:],
+             separator,
+             'Main Results (int. analysis)']
+    lines.extend(f"{name!s:<27}{value!s:<23}{unit}"
+                 for name, value, unit in output_list)
+    lines += [separator,
+              'Range Calculation Results (ext. analysis)',
+              row('Max. payload range', r_maxpayload, '[m]'),
+              row('Ferry range', r_ferry, '[m]'),
+              separator,
+              'AVL Results (ext. analysis)',
+              row('CL/CD', cl_cd, '[-]'),
+              row('Alpha_cruise', avl_results['Alpha'], '[deg]'),
+              row('CL_tot', avl_results['CLtot'], '[-]'),
+              row('CD_tot', avl_results['CDtot'], '[-]'),
+              row('CD_ind', avl_results['CDind'], '[-]'),
+              row('CD_0', avl_results['CDvis'], '[-]'),
+              row('MAC', avl_results['Cref'], '[m]'),
+              row('Planform Area', avl_results['Sref'], '[m2]'),
+              row('Oswald efficiency factor', avl_results['e'], '[-]'),
+              separator,
+              'C.G. Analysis Results (ext. analysis)',
+              row('C.G. position', cg_mac, '[%]'),
+              row('Operating Empty Mass', cg_analysis[2], '[kg]'),
+              separator,
+              'Aero Engine Calculation Results (ext. analysis)',
+              row('tsfc_cal', aero_analysis[0], '[kg/Ns]'),
+              row('mdot_f_cal', aero_analysis[1], '[kg/s]'),
+              '==========================================================']
 
-        f.writelines('----------------------------------------------------------\n')
-        f.writelines('Range Calculation Results (ext. analysis)\n')
-        f.writelines(f"{'Max. payload range'.ljust(26)} {str(r_maxpayload).ljust(22)} [m]\n")
-        f.writelines(f"{'Ferry range'.ljust(26)} {str(r_ferry).ljust(22)} [m]\n")
-
-        f.writelines('----------------------------------------------------------\n')
-        f.writelines('AVL Results (ext. analysis)\n')
-        f.writelines(f"{'CL/CD'.ljust(26)} {str(cl_cd).ljust(22)} [-]\n")
-        f.writelines(f"{'Alpha_cruise'.ljust(26)} "
-                     f"{str(avl_results['Totals']['Alpha']).ljust(22)} [deg]\n")
-        f.writelines(f"{'CL_tot'.ljust(26)} {str(avl_results['Totals']['CLtot']).ljust(22)} [-]\n")
-        f.writelines(f"{'CD_tot'.ljust(26)} {str(avl_results['Totals']['CDtot']).ljust(22)} [-]\n")
-        f.writelines(f"{'CD_ind'.ljust(26)} {str(avl_results['Totals']['CDind']).ljust(22)} [-]\n")
-        f.writelines(f"{'CD_0'.ljust(26)} {str(avl_results['Totals']['CDvis']).ljust(22)} [-]\n")
-        f.writelines(f"{'MAC'.ljust(26)} {str(avl_results['Totals']['Cref']).ljust(22)} [m]\n")
-        f.writelines(f"{'Planform Area'.ljust(26)}"
-                     f" {str(avl_results['Totals']['Sref']).ljust(22)} [m2]\n")
-        f.writelines(f"{'Oswald efficiency factor'.ljust(26)}"
-                     f" {str(avl_results['Totals']['e']).ljust(22)} [-]\n")
-
-        f.writelines('----------------------------------------------------------\n')
-        f.writelines('C.G. Analysis Results (ext. analysis)\n')
-        f.writelines(f"{'C.G. position'.ljust(26)} {str(cg_mac).ljust(22)} [%]\n")
-        f.writelines(f"{'Operating Empty Mass'.ljust(26)} {str(cg_analysis[2]).ljust(22)} [kg]\n")
-
-        f.writelines('----------------------------------------------------------\n')
-        f.writelines('Aero Engine Calculation Results (ext. analysis)\n')
-        f.writelines(f"{'tsfc_cal'.ljust(26)} {str(aero_analysis[0]).ljust(22)} [kg/Ns]\n")
-        f.writelines(f"{'mdot_f_cal'.ljust(26)} {str(aero_analysis[1]).ljust(22)} [kg/s]\n")
-        f.writelines('==========================================================')
+    with open(filename + '.txt', "w", encoding='utf-8', newline='\n') as f:
+        f.write('\n'.join(lines))
@@ -1,6 +1,7 @@
-from parapy.core import Input, Part, child
-from parapy.geom import GeomBase, Box, translate, rotate
+from parapy.core import Input, Attribute, Part
+from parapy.geom import GeomBase, Box, Compound, translate, rotate
 from parapy.core.validate import GreaterThan, is_string
+import numpy as np
 
 
 class Seat(GeomBase):
@@ -37,10 +38,20 @@ class Seat(GeomBase):
     armrest_width = Input(0.05, private=not (__name__ == '__main__'), validator=GreaterThan(0))
     armrest_height_ground = Input(0.60, validator=GreaterThan(0))
 
+    @Attribute
+    def seat_block_width(self):
+        """Total width of the seats in the block, excluding the armrests"""
+        return self.n_seats * self.seat_width
+
+    @Attribute
+    def chair_leg_spacing(self):
+        """Distance between consecutive chair legs, shared by all legs of the seat block"""
+        return (self.seat_block_width - self.chair_leg_width) / self.n_seats
+
     @Part(in_tree=False)
     def simple_seat_volume(self):
         return Box(self.seat_depth,
-                   self.n_seats * self.seat_width + self.armrest_width,
+                   self.seat_block_width + self.armrest_width,
                    self.seat_height,
                    transparency=0.5,
                    color='red')
@@ -49,68 +60,80 @@ class Seat(GeomBase):
     def seat_cushion(self):
         """Horizontal part of chair"""
         return Box(self.seat_depth * 0.8,
-                   self.n_seats * self.seat_width,
+                   self.seat_block_width,
                    self.seat_cushion_thickness,
                    position=translate(self.position,
                                       'y', 0.5 * self.armrest_width,
                                       'z', self.chair_leg_height))
 
+    @Attribute
+    def seat_y_positions(self):
+        """Local y positions of the individual seats in the block"""
+        return np.arange(self.n_seats) * self.seat_width
+
+    @Attribute
+    def chair_leg_y_positions(self):
+        """Local y positions of the chair legs, one more than the number of seats"""
+        return 0.5 * self.armrest_width + np.arange(self.n_seats + 1) * self.chair_leg_spacing
+
+    # The seat backs, armrests and chair legs repeat once per seat. Each set is built as a
+    # single compound of boxes rather than as quantified parts.
+
     @Part
     def seat_back(self):
         """Back of chair, at an angle of 10 deg for illustration. Suppressed for type='crew'"""
-        return Box(self.back_cushion_thickness,
-                   self.seat_width - self.armrest_width,
-                   self.seat_height - self.chair_leg_height - self.seat_cushion_thickness,
-                   quantify=self.n_seats,
-                   position=rotate(translate(self.position,
-                                             'x', self.seat_depth * 0.8 -
-                                             self.back_cushion_thickness,
-                                             'y', self.armrest_width + child.index *
-                                             self.seat_width,
-                                             'z', self.chair_leg_height +
-                                             self.seat_cushion_thickness),
-                                   'y', 10, deg=True),
-                   suppress=self.type == 'crew')
+        return Compound(built_from=[
+            Box(self.back_cushion_thickness,
+                self.seat_width - self.armrest_width,
+                self.seat_height - self.chair_leg_height - self.seat_cushion_thickness,
+                position=rotate(translate(self.position,
+                                          'x', self.seat_depth * 0.8 -
+                                          self.back_cushion_thickness,
+                                          'y', self.armrest_width + y,
+                                          'z', self.chair_leg_height +
+                                          self.seat_cushion_thickness),
+                                'y', 10, deg=True))
+            for y in self.seat_y_positions.tolist()],
+            suppress=self.type == 'crew')
 
     @Part
     def armrests(self):
         """Simple armrests. Suppressed for type='pilot' and type='crew'"""
-        return Box(self.seat_depth * 0.6,
-                   self.armrest_width,
-                   self.armrest_width,
-                   quantify=self.n_seats + 1,
-                   position=translate(self.position,
-                                      'x', 0.2 * self.seat_depth,
-                                      'y', child.index * self.seat_width,
-                                      'z', self.armrest_height_ground),
-                   suppress=self.type == 'pilot' or self.type == 'crew')
+        return Compound(built_from=[
+            Box(self.seat_depth * 0.6,
+                self.armrest_width,
+                self.armrest_width,
+                position=translate(self.position,
+                                   'x', 0.2 * self.seat_depth,
+                                   'y', y,
+                                   'z', self.armrest_height_ground))
+            for y in (self.seat_y_positions.tolist() + [self.seat_block_width])],
+            suppress=self.type == 'pilot' or self.type == 'crew')
 
     @Part
     def fwd_chair_leg(self):
-        """Simple front chair leg. Suppressed for type='crew'"""
-        return Box(self.chair_leg_width,
-                   self.chair_leg_width,
-                   self.chair_leg_height,
-                   quantify=self.n_seats + 1,
-                   position=translate(self.position,
-                                      'y', 0.5 * self.armrest_width +
-                                      child.index * ((self.n_seats * self.seat_width -
-                                                      self.chair_leg_width) / self.n_seats)),
-                   suppress=self.type == 'crew')
+        """Simple front chair legs. Suppressed for type='crew'"""
+        return Compound(built_from=[
+            Box(self.chair_leg_width,
+                self.chair_leg_width,
+                self.chair_leg_height,
+                position=translate(self.position,
+                                   'y', y))
+            for y in self.chair_leg_y_positions.tolist()],
+            suppress=self.type == 'crew')
 
     @Part
     def aft_chair_leg(self):
-        """Simple back chair leg. Suppressed for type='crew'"""
-        return Box(self.chair_leg_width,
-                   self.chair_leg_width,
-                   self.chair_leg_height,
-                   quantify=self.n_seats + 1,
-                   position=translate(self.position,
-                                      'y', 0.5 * self.armrest_width +
-                                      child.index * ((self.n_seats * self.seat_width -
-                                                      self.chair_leg_width) / self.n_seats),
-                                      'x', self.seat_depth * 0.8 - self.chair_leg_width),
-                   suppress=self.type == 'crew')
+        """Simple back chair legs. Suppressed for type='crew'"""
+        return Compound(built_from=[
+            Box(self.chair_leg_width,
+                self.chair_leg_width,
+                self.chair_leg_height,
+                position=translate(self.position,
+                                   'y', y,
+                                   'x', self.seat_depth * 0.8 - self.chair_leg_width))
+            for y in self.chair_leg_y_positions.tolist()],
+            suppress=self.type == 'crew')
 
 
 if __name__ == '__main__':
@@ -53,42 +53,47 @@
 #
 # display(obj, config, model_name="A320_H2_retrofit")
 
+from ast import literal_eval
+from itertools import islice
 from parapy.core.snapshot import read_snapshot
 from parapy.gui import display
-from tkinter import Tk, messagebox
-from tkinter.filedialog import askopenfilename
 from hydrogen_aircraft import Aircraft
 
-# Ask user whether they want to open a previous save
-Tk().withdraw()
-user_answer = messagebox.askyesno('Open previous save',
-                                  'Welcome to the hydrogen retrofit of a single-aisle '
-                                  'aircraft KBE application.\n\nDo you want to open a '
-                                  'previous save? If so, note that the input file will '
-                                  'ignored.')
 
-# If previous save desired, open json file
-if user_answer:
-    old_save_path = askopenfilename(title='Open previous save',
-                                    filetypes=[('json', '.json')])
-    with open(old_save_path) as f:
-        obj = read_snapshot(f)
+def load_aircraft():
+    """Ask the user for a previous save or an input file and return the loaded Aircraft"""
+    from tkinter import Tk, messagebox
+    from tkinter.filedialog import askopenfilename
 
-# If no previous save, open Aircraft with input file
-else:
+    # Ask user whether they want to open a previous save
+    Tk().withdraw()
+    user_answer = messagebox.askyesno('Open previous save',
+                                      'Welcome to the hydrogen retrofit of a single-aisle '
+                                      'aircraft KBE application.\n\nDo you want to open a '
+                                      'previous save? If so, note that the input file will '
+                                      'ignored.')
+
+    # If previous save desired, open json file
+    if user_answer:
+        old_save_path = askopenfilename(title='Open previous save',
+                                        filetypes=[('json', '.json')])
+        with open(old_save_path) as f:
+            return read_snapshot(f)
+
+    # If no previous save, open Aircraft with input file
     input_file_path = askopenfilename(title='Open input file',
                                       filetypes=[('txt', '.txt')])
     obj = Aircraft()
 
     # update values with input file values
     with open(input_file_path) as f:
-        i = 0
-        for line in f:
-            if i > 3:  # the input file should have four lines of text that are ignored
-                (key, val) = line.split()
-                exec('obj.' + str(key) + '=' + str(val))
-            i += 1
+        # the input file should have four lines of text that are ignored
+        for line in islice(f, 4, None):
+            (key, val) = line.split()
+            setattr(obj, key, literal_eval(val))
+    return obj
 
-# Display the Aircraft in GUI
-display(obj, autodraw=True)
 
+if __name__ == '__main__':
+    # Display the Aircraft in GUI
+    display(load_aircraft(), autodraw=True)